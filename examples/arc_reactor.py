@@ -14,32 +14,6 @@ import microbit
 from sinobit import display
 
 
-# Define some functions in Python code to draw straight lines and boxes.
-def hline(x, y, width, color):
-    # Horizontal line at x, y position and width pixels to the right.
-    # Color is a boolean true/false for on or off pixels.
-    for i in range(x, x+width):
-        # The set_pixel function will set a pixel at the provided x, y position
-        # to on or off with the provided true/false color value.
-        # Remember you won't see the pixel LED turn on/off until write is
-        # called!
-        display.set_pixel(i, y, color)
-
-def vline(x, y, height, color):
-    # Vertical line at x, y position and height pixels down.
-    # Color is a boolean true/false for on or off pixels.
-    for i in range(y, y+height):
-        display.set_pixel(x, i, color)
-
-def box(x, y, width, height, color):
-    # Draw a 1 pixel wide box with upper left corner at x, y and of the
-    # specified width and height of pixels.  Color is a boolean true/false
-    # for turning the pixels on or off.
-    hline(x, y, width, color)
-    hline(x, y+height-1, width, color)
-    vline(x, y, height, color)
-    vline(x+width-1, y, height, color)
-
 # Clear the display.  Note that all the display commands just update the
 # internal memory and have to be followed by a write call to update the LEDs
 # with the new memory value.  This way you can make a lot of pixel changes at
@@ -60,20 +34,23 @@ while True:
         # Calculate the size of the square so that it shrinks down with
         # each step.
         size = 12-2*i
-        # Draw the square.
-        box(i, i, size, size, True)
+        # Draw the square.  The rect function draws a 1 pixel wide box with
+        # its upper left corner at x, y and the specified width and height.
+        # There are also hline, vline, fill_rect and line functions, all
+        # taking an optional color that defaults to on.
+        display.rect(i, i, size, size, True)
         # If we're past the first iteration draw a second square behind this
         # one to double the size of the box.
         if i > 0:
-            box(i-1, i-1, size+2, size+2, True)
+            display.rect(i-1, i-1, size+2, size+2, True)
         # Finally make sure to call write on the display to push out all the
-        # pixels that were set with the box drawing commands above.  This will
+        # pixels that were set with the rect drawing commands above.  This will
         # turn on and off the appropriate LEDs to draw this frame of the
         # animation.
         display.write()
         # Once the pixels are lit you can change their brightness (you _don't_
-        # have to call write after changing brightness, it will instantly
-        # update!).  There are 16 brightness levels from 0 (lowest) to 15
+        # have to call write after changing brightness, it will update on its
+        # own!).  There are 16 brightness levels from 0 (lowest) to 15
         # (maximum, the defaul).  We'll loop down from 15 to 0 to dim the
         # square that was just drawn and make it appear to fade away over time.
         for b in range(15, -1, -1):
@@ -0,0 +1,15 @@
+# Greyscale gradient demo.  Switches the display to 8 levels of greyscale and
+# sweeps a gradient across the columns.  More levels give smoother shading but
+# cost more CPU time and flicker more, fewer levels are cheaper.
+import microbit
+import sinobit
+
+sinobit.display.levels(8)
+offset = 0
+while True:
+    for x in range(12):
+        for y in range(12):
+            sinobit.display.set_pixel(x, y, (x + y + offset) % 8)
+    sinobit.display.write()
+    microbit.sleep(100)
+    offset += 1
@@ -7,13 +7,14 @@ import sinobit
 
 MESSAGE = '¿Hablas español? Parlez-vous Français?'
 
-x = 11
 width = sinobit.display.text_width(MESSAGE)
 while True:
+    # Each ticker call moves the display one column to the left and only
+    # draws the one new column of the message coming in on the right, which
+    # is much quicker than clearing and drawing the whole message each step.
+    # Keep going 12 columns past the end so the message scrolls off.
     sinobit.display.clear()
-    sinobit.display.text(x, 0, MESSAGE)
-    sinobit.display.write()
-    microbit.sleep(100)
-    x -= 1
-    if x < -width:
-        x = 11
+    for offset in range(width + 12):
+        sinobit.display.ticker(MESSAGE, offset)
+        sinobit.display.write()
+        microbit.sleep(100)
@@ -332,6 +332,26 @@ QDEF(MP_QSTR_mem_alloc, (const byte*)"\x52\x09" "mem_alloc")
 QDEF(MP_QSTR_sinobit, (const byte*)"\xe1\x07" "sinobit")
 QDEF(MP_QSTR_brightness, (const byte*)"\x4c\x0a" "brightness")
 QDEF(MP_QSTR_text_width, (const byte*)"\x21\x0a" "text_width")
+QDEF(MP_QSTR_glyph_cache_stats, (const byte*)"\x22\x11" "glyph_cache_stats")
+QDEF(MP_QSTR_glyph_cache_reset, (const byte*)"\x76\x11" "glyph_cache_reset")
+QDEF(MP_QSTR_full, (const byte*)"\xd6\x04" "full")
+QDEF(MP_QSTR_bits_shifted, (const byte*)"\x37\x0c" "bits_shifted")
+QDEF(MP_QSTR_send_time, (const byte*)"\xb3\x09" "send_time")
+QDEF(MP_QSTR_levels, (const byte*)"\x40\x06" "levels")
+QDEF(MP_QSTR_get_buffer, (const byte*)"\xec\x0a" "get_buffer")
+QDEF(MP_QSTR_x, (const byte*)"\xdd\x01" "x")
+QDEF(MP_QSTR_y, (const byte*)"\xdc\x01" "y")
+QDEF(MP_QSTR_buffer, (const byte*)"\xe5\x06" "buffer")
+QDEF(MP_QSTR_hline, (const byte*)"\x83\x05" "hline")
+QDEF(MP_QSTR_vline, (const byte*)"\x1d\x05" "vline")
+QDEF(MP_QSTR_rect, (const byte*)"\xe5\x04" "rect")
+QDEF(MP_QSTR_fill_rect, (const byte*)"\x35\x09" "fill_rect")
+QDEF(MP_QSTR_line, (const byte*)"\xcb\x04" "line")
+QDEF(MP_QSTR_dx, (const byte*)"\x99\x02" "dx")
+QDEF(MP_QSTR_dy, (const byte*)"\x98\x02" "dy")
+QDEF(MP_QSTR_ticker, (const byte*)"\x87\x06" "ticker")
+QDEF(MP_QSTR_scroll_text, (const byte*)"\xea\x0b" "scroll_text")
+QDEF(MP_QSTR_prepare_text, (const byte*)"\x86\x0c" "prepare_text")
 QDEF(MP_QSTR_help, (const byte*)"\x94\x04" "help")
 QDEF(MP_QSTR_input, (const byte*)"\x73\x05" "input")
 QDEF(MP_QSTR_collections, (const byte*)"\xe0\x0b" "collections")
@@ -22,6 +22,7 @@
 #define MICROPY_REPL_EVENT_DRIVEN   (0)
 #define MICROPY_REPL_EMACS_KEYS     (1)
 #define MICROPY_REPL_AUTO_INDENT    (1)
+#define MICROPY_REPL_RAW_PASTE_WINDOW (32) // half of the UART receive buffer
 #define MICROPY_HELPER_REPL         (1)
 #define MICROPY_HELPER_LEXER_UNIX   (0)
 #define MICROPY_ENABLE_SOURCE_LINE  (1)
@@ -167,6 +168,7 @@ extern const struct _mp_obj_module_t speech_module;
     const struct _pwm_events *pwm_pending_events; \
     struct _compass_calibration_t *compass_calibration_data; \
     struct _music_data_t *music_data; \
+    struct _sinobit_marquee_t *sinobit_marquee; \
 
 // We need to provide a declaration/definition of alloca()
 #include <alloca.h>
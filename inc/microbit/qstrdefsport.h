@@ -4,6 +4,26 @@
 Q(sinobit)
 Q(brightness)
 Q(text_width)
+Q(glyph_cache_stats)
+Q(glyph_cache_reset)
+Q(full)
+Q(bits_shifted)
+Q(send_time)
+Q(levels)
+Q(get_buffer)
+Q(x)
+Q(y)
+Q(buffer)
+Q(hline)
+Q(vline)
+Q(rect)
+Q(fill_rect)
+Q(line)
+Q(dx)
+Q(dy)
+Q(ticker)
+Q(scroll_text)
+Q(prepare_text)
 
 // microbit inherited qstrs:
 Q(help)
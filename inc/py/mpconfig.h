@@ -428,6 +428,14 @@
 #define MICROPY_REPL_AUTO_INDENT (0)
 #endif
 
+// Window size for raw-paste mode in the raw REPL: the host may send this many
+// bytes before it waits for the next acknowledgement.  The device gives an
+// extra window when raw-paste starts, so twice this must fit in the port's
+// stdin buffer
+#ifndef MICROPY_REPL_RAW_PASTE_WINDOW
+#define MICROPY_REPL_RAW_PASTE_WINDOW (256)
+#endif
+
 // Whether port requires event-driven REPL functions
 #ifndef MICROPY_REPL_EVENT_DRIVEN
 #define MICROPY_REPL_EVENT_DRIVEN (0)
@@ -26,18 +26,53 @@
 
 extern "C" {
 
+#include <cstddef>
 #include <cstdint>
 
+// The framebuffer holds one 16 bit word for each of the 12 display columns.
+// The pixel at row y of a column is bit (15 - y), the low 4 bits are unused.
+extern uint16_t framebuffer[12];
+
 void framebuffer_set(uint8_t x, uint8_t y, bool value);
 
 bool framebuffer_get(uint8_t x, uint8_t y);
 
-void framebuffer_write();
+void framebuffer_set_level(uint8_t x, uint8_t y, uint8_t level);
+
+uint8_t framebuffer_get_level(uint8_t x, uint8_t y);
+
+uint8_t framebuffer_levels();
+
+bool framebuffer_set_levels(uint8_t levels);
+
+void framebuffer_write(bool full);
+
+bool framebuffer_write_pending();
+
+uint32_t framebuffer_bits_shifted();
+
+uint32_t framebuffer_send_time();
 
 void framebuffer_fill(bool value);
 
+void framebuffer_fill_rect(int x, int y, int width, int height, uint8_t level);
+
+void framebuffer_hline(int x, int y, int width, uint8_t level);
+
+void framebuffer_vline(int x, int y, int height, uint8_t level);
+
+void framebuffer_rect(int x, int y, int width, int height, uint8_t level);
+
+void framebuffer_line(int x0, int y0, int x1, int y1, uint8_t level);
+
+void framebuffer_scroll(int dx, int dy, uint8_t fill);
+
+void framebuffer_blit(const uint8_t *buffer, size_t columns, int x, int y);
+
 void sinobit_display_init();
 
+void sinobit_display_tick();
+
 }
 
 #endif
@@ -29,13 +29,33 @@ extern "C" {
 #include <cstdint>
 
 #include "py/obj.h"
+#include "zpixfont.h"
+
+// A character of a string resolved to its glyph, character is NULL if it's
+// not in the font.
+typedef struct {
+  const zpixfont_character_t* character;
+  uint8_t dwidth;
+} text_glyph_t;
 
 void text_draw_char(int x0, int y0, uint16_t encoding);
 
 void text_draw_string(int x0, int y0, mp_obj_t string);
 
+void text_draw_glyph_column(int x, int y0, const zpixfont_character_t* character, int gx);
+
+void text_draw_column(int x, int y0, mp_obj_t string, int offset);
+
+size_t text_glyphs(mp_obj_t string, text_glyph_t* glyphs);
+
+void text_render_columns(mp_obj_t string, uint8_t* buffer, size_t columns);
+
 uint16_t text_width(mp_obj_t string);
 
+void text_glyph_cache_stats(uint32_t* hits, uint32_t* misses);
+
+void text_glyph_cache_reset();
+
 }
 
 #endif
@@ -273,6 +273,51 @@ int pyexec_event_repl_process_char(int c) {
 
 #else // MICROPY_REPL_EVENT_DRIVEN
 
+// Raw-paste mode, entered from the raw REPL with ctrl-E A ctrl-A.  The host is
+// given a window size and sends that many bytes at a time, each further window
+// only after a \x01 from us, so it can send at full speed without overrunning
+// the stdin buffer.  ctrl-D ends the input, which is acknowledged with \x04 and
+// then executed like a raw REPL command; ctrl-C cancels it.
+STATIC int pyexec_raw_paste(vstr_t *line, int mode) {
+    vstr_reset(line);
+    if (mode != 'A') {
+        // unsupported variant of raw-paste mode
+        mp_hal_stdout_tx_strn("R\x00", 2);
+        return 0;
+    }
+    char reply[4] = {'R', 1, MICROPY_REPL_RAW_PASTE_WINDOW & 0xff, MICROPY_REPL_RAW_PASTE_WINDOW >> 8};
+    mp_hal_stdout_tx_strn(reply, 4);
+    // the host may send a window more straight away, so two are in flight
+    mp_hal_stdout_tx_strn("\x01", 1);
+
+    mp_uint_t window_remain = MICROPY_REPL_RAW_PASTE_WINDOW;
+    for (;;) {
+        int c = mp_hal_stdin_rx_chr();
+        if (c == CHAR_CTRL_C || c == CHAR_CTRL_D) {
+            // acknowledge the end of the input
+            mp_hal_stdout_tx_strn("\x04", 1);
+            if (c == CHAR_CTRL_C) {
+                vstr_reset(line);
+                return 0;
+            }
+            break;
+        }
+        vstr_add_byte(line, c);
+        if (--window_remain == 0) {
+            // ask for the next window
+            mp_hal_stdout_tx_strn("\x01", 1);
+            window_remain = MICROPY_REPL_RAW_PASTE_WINDOW;
+        }
+    }
+
+    mp_lexer_t *lex = mp_lexer_new_from_str_len(MP_QSTR__lt_stdin_gt_, line->buf, line->len, 0);
+    if (lex == NULL) {
+        printf("\x04MemoryError\n\x04");
+        return 0;
+    }
+    return parse_compile_execute(lex, MP_PARSE_FILE_INPUT, EXEC_FLAG_PRINT_EOF);
+}
+
 int pyexec_raw_repl(void) {
     vstr_t line;
     vstr_init(&line, 32);
@@ -283,9 +328,15 @@ raw_repl_reset:
     for (;;) {
         vstr_reset(&line);
         mp_hal_stdout_tx_str(">");
+        bool raw_paste = false;
         for (;;) {
             int c = mp_hal_stdin_rx_chr();
             if (c == CHAR_CTRL_A) {
+                if (line.len == 2 && line.buf[0] == CHAR_CTRL_E) {
+                    // ctrl-E x ctrl-A: enter raw-paste mode
+                    raw_paste = true;
+                    break;
+                }
                 // reset raw REPL
                 goto raw_repl_reset;
             } else if (c == CHAR_CTRL_B) {
@@ -306,6 +357,19 @@ raw_repl_reset:
             }
         }
 
+        if (raw_paste) {
+            char mode = line.buf[1];
+            int ret = pyexec_raw_paste(&line, mode);
+            if (ret & PYEXEC_FORCED_EXIT) {
+                return ret;
+            }
+            if (mode == 'A') {
+                // a raw-paste ends with the banner, like a reset raw REPL
+                goto raw_repl_reset;
+            }
+            continue;
+        }
+
         // indicate reception of command
         mp_hal_stdout_tx_str("OK");
 
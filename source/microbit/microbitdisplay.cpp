@@ -44,24 +44,32 @@ extern "C" {
 // New implementation of image buffer pixel drawing that maps the 5x5 pixels
 // of the micro:bit to the 12x12 display of the sino:bit.  This conversion is
 // done by upsampling to 2x2 pixel blocks on the sino:bit display, framed by
-// a 1 pixel wide unused frame around the pixels.  Any brightness values are
-// ignored since the sinobit display can't set individual pixel brightness.
+// a 1 pixel wide unused frame around the pixels.  Brightness values 0-9 are
+// scaled to the levels of the sinobit display, so without greyscale any
+// non-zero brightness is an on pixel.
 static void mock_image_buffer_set_pixel(uint8_t x, uint8_t y, uint8_t c) {
     // Calculate location within the 12x12 of the sinobit display.
     // Note that we need to swap the axes to orient the display correctly
     // (although A and B buttons are swapped physically on the board).
     uint8_t sinobit_y = 1+2*x;
     uint8_t sinobit_x = 1+2*y;
-    // Turn any non-zero brightness to an on pixel.
-    bool sinobit_c = c > 0 ? true : false;
+    // Scale the brightness, keeping any non-zero brightness visible.
+    uint8_t max = framebuffer_levels()-1;
+    uint8_t level = 0;
+    if (c > 0) {
+        level = (min(c, MAX_BRIGHTNESS)*max + MAX_BRIGHTNESS/2)/MAX_BRIGHTNESS;
+        if (level == 0) {
+            level = 1;
+        }
+    }
     // Set the four pixels of this 2x2 chunk.
-    framebuffer_set(sinobit_x,   sinobit_y,   sinobit_c);
-    framebuffer_set(sinobit_x+1, sinobit_y,   sinobit_c);
-    framebuffer_set(sinobit_x,   sinobit_y+1, sinobit_c);
-    framebuffer_set(sinobit_x+1, sinobit_y+1, sinobit_c);
-    // Immediately write to the display.  This would normally happen in the
-    // tick callback a short while later, but writing now should work.
-    framebuffer_write();
+    framebuffer_set_level(sinobit_x,   sinobit_y,   level);
+    framebuffer_set_level(sinobit_x+1, sinobit_y,   level);
+    framebuffer_set_level(sinobit_x,   sinobit_y+1, level);
+    framebuffer_set_level(sinobit_x+1, sinobit_y+1, level);
+    // Queue the frame for the display tick.  This only copies the framebuffer
+    // so drawing a whole image still ends up as a single transfer.
+    framebuffer_write(false);
 }
 
 static uint8_t mock_image_buffer_get_pixel(uint8_t x, uint8_t y) {
@@ -70,21 +78,15 @@ static uint8_t mock_image_buffer_get_pixel(uint8_t x, uint8_t y) {
     // (although A and B buttons are swapped physically on the board).
     uint8_t sinobit_y = 1+2*x;
     uint8_t sinobit_x = 1+2*y;
-    // Check if all 4 pixels of this 2x2 are set.  This isn't perfect since
-    // the user might use the sinobit module to manipulate individual pixels.
-    // Perhaps consider keeping track of display buffer state separately.
-    if (framebuffer_get(sinobit_x,   sinobit_y)   &&
-        framebuffer_get(sinobit_x+1, sinobit_y)   &&
-        framebuffer_get(sinobit_x,   sinobit_y+1) &&
-        framebuffer_get(sinobit_x+1, sinobit_y+1)) {
-        // Pixel is set, return max brightness.  Note this will lose brightness
-        // information which might break certain code that depends on it!
-        // Again perhaps store this separately for compatibility.
-        return 9; // Max brightness (9)
-    }
-    else {
-        return 0; // Off
-    }
+    // Use the lowest level of the 2x2 pixels.  This isn't perfect since the
+    // user might use the sinobit module to manipulate individual pixels, and
+    // scaling back to 0-9 loses brightness information without greyscale.
+    uint8_t level = framebuffer_get_level(sinobit_x, sinobit_y);
+    level = min(level, framebuffer_get_level(sinobit_x+1, sinobit_y));
+    level = min(level, framebuffer_get_level(sinobit_x,   sinobit_y+1));
+    level = min(level, framebuffer_get_level(sinobit_x+1, sinobit_y+1));
+    uint8_t max = framebuffer_levels()-1;
+    return (level*MAX_BRIGHTNESS + max/2)/max;
 }
 
 void microbit_display_show(microbit_display_obj_t *display, microbit_image_obj_t *image) {
@@ -281,8 +283,10 @@ static void microbit_display_update(void) {
 /* This is the top-level animation/display callback.  It is not a registered
  * callback. */
 void microbit_display_tick(void) {
-    // The tick callback now only needs to drive animation updates.
     microbit_display_update();
+    // Send any frame written since the last tick (including the one drawn by
+    // the animation update above) to the sino:bit display.
+    sinobit_display_tick();
 }
 
 
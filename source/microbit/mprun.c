@@ -141,6 +141,8 @@ void mp_run(void) {
 
     memset(&MP_STATE_PORT(async_data)[0], 0, sizeof(MP_STATE_PORT(async_data)));
     MP_STATE_PORT(music_data) = NULL;
+    // Stop the display tick from scrolling text held on the heap being reset.
+    MP_STATE_PORT(sinobit_marquee) = NULL;
 
     mp_deinit();
 }
@@ -27,15 +27,20 @@
  */
 extern "C" {
 
+#include <string.h>
+
 #include "py/mpprint.h"
 #include "py/mphal.h"
 #include "py/obj.h"
+#include "py/runtime.h"
 #include "spi_api.h"
+#include "us_ticker_api.h"
 #include "modmicrobit.h"
 #include "modsinobit.h"
 #include "microbitpin.h"
 #include "microbitobj.h"
 #include "nrf_gpio.h"
+#include "lib/ticker.h"
 #include "sinobitdisplay.h"
 #include "sinobittext.h"
 #include "zpixfont.h"
@@ -73,6 +78,22 @@ extern "C" {
 #define HT_RD 22
 #define HT_WR 23
 
+// The DATA and WR pins are the nRF51 SPI MOSI and SCK pins so display data
+// can be shifted out by an SPI peripheral instead of toggling the pins in
+// software.  The peripheral is only borrowed for the length of a transfer and
+// the bit-bang path is used when it's busy (e.g. with microbit.spi or I2C, which
+// share the same registers), or when SINOBIT_DISPLAY_SPI is defined as 0.
+#ifndef SINOBIT_DISPLAY_SPI
+#define SINOBIT_DISPLAY_SPI (1)
+#endif
+#ifndef SINOBIT_DISPLAY_SPI_PERIPHERAL
+#define SINOBIT_DISPLAY_SPI_PERIPHERAL NRF_SPI1
+#endif
+// HT1632C WR cycle time is 500ns minimum at 3V, so 2MHz is the fastest clock.
+#ifndef SINOBIT_DISPLAY_SPI_FREQUENCY
+#define SINOBIT_DISPLAY_SPI_FREQUENCY SPI_FREQUENCY_FREQUENCY_M2
+#endif
+
 static NRF_GPIO_Type *gpiobase = (NRF_GPIO_Type *)NRF_GPIO_BASE;
 
 static inline void CSon(void) { gpiobase->OUTCLR = 1 << HT_CS; }
@@ -92,10 +113,68 @@ static uint8_t com[12] = {
 
 uint16_t framebuffer[12] = {0};
 
+// Copy of the columns that were last sent to the display.  Only the columns
+// that differ from this copy need to be sent again when writing.
+static uint16_t framebuffer_sent[12] = {0};
+
+// Front buffer with the frame waiting to be sent by the display tick.  Python
+// code draws into framebuffer (the back buffer) which is copied here on write.
+static volatile uint16_t framebuffer_front[12] = {0};
+static volatile bool write_pending = false;
+static volatile bool write_full = false;
+
+// Brightness to send on the next display tick, or -1 for no change.
+static volatile int8_t brightness_pending = -1;
+
+// Greyscale is done by binary code modulation: pixel levels are split into
+// bit planes and plane k is shown for GREYSCALE_PLANE_TICKS << k fast ticker
+// ticks (16us each) before moving to the next one.  Pixels set in framebuffer
+// are on in every plane, i.e. max level.  More levels means a longer cycle and
+// one more transfer per cycle, so they're traded against flicker and CPU load.
+#define GREYSCALE_MAX_BITS 4
+#define GREYSCALE_PLANE_TICKS 32
+#define GREYSCALE_TICKER_INDEX 1
+
+static uint8_t greyscale_bits = 1;
+static uint16_t greyscale_planes[GREYSCALE_MAX_BITS][12] = {{0}};
+static volatile uint16_t greyscale_front[GREYSCALE_MAX_BITS][12] = {{0}};
+// Set while framebuffer_write copies to the front buffers, so the tickers
+// don't use or replace a half copied frame.
+static volatile bool greyscale_copying = false;
+// Set by a framebuffer_write from a tick that interrupted another one, which
+// then copies the frame again before it finishes.
+static volatile bool write_again = false;
+static uint8_t greyscale_plane = 0;
+
+// Text scrolled in the background by the display tick.  The glyphs of the
+// message are looked up once when it's started, and after that the tick only
+// draws the one new column coming in at the right edge every delay ms.  It's
+// kept on the heap through the sinobit_marquee root pointer.
+typedef struct _sinobit_marquee_t {
+    mp_uint_t delay;
+    mp_uint_t elapsed;
+    uint16_t width;        // Width of the message in pixels.
+    uint16_t offset;       // Message column to draw next.
+    uint16_t cursor;       // First glyph that can still cover offset.
+    uint16_t cursor_start; // Message column of that glyph's left edge.
+    uint16_t count;
+    int8_t y;
+    bool loop;
+    text_glyph_t glyphs[];
+} sinobit_marquee_t;
+
+static volatile bool marquee_done = false;
+
+// Total number of bits clocked out to the HT1632C, useful for profiling.
+static uint32_t bits_shifted = 0;
+// Microseconds spent sending to the display from the tickers.
+static uint32_t send_time = 0;
+
 
 static void HT1632C_Write(uint8_t Data, uint8_t cnt)      //MCU writes the data to ht1632c, and the high position is in front
 {
     uint8_t i;
+    bits_shifted += cnt;
     for (i = 0; i < cnt; i++) {
         WRon();
         if (Data & 0x80) {
@@ -117,15 +196,11 @@ static void HT1632C_Write_CMD(uint8_t cmd) //MCU writes commands to ht1632c
     CSoff();
 }
 
-static void HT1632C_Write_DAT(uint8_t Addr, const uint16_t data[], uint8_t num)
+static void HT1632C_Write_Column(uint16_t d, uint8_t cnt)
 {
-    WRdata();
-    CSon();
-    HT1632C_Write(0xa0, 3);
-    HT1632C_Write(Addr << 1, 7);
-
-    uint16_t d = data[num];
-    for (uint8_t i = 0; i < 12; i++) {
+    // Write the top cnt bits (up to 16) of a column word.
+    bits_shifted += cnt;
+    for (uint8_t i = 0; i < cnt; i++) {
         WRon();
         if (d & 0x8000) {
             DATA1();
@@ -135,8 +210,75 @@ static void HT1632C_Write_DAT(uint8_t Addr, const uint16_t data[], uint8_t num)
         d <<= 1;
         WRoff();
     }
+}
+
+static void HT1632C_Write_DAT(uint8_t first, uint8_t last, const uint16_t data[])
+{
+    // Write columns first to last (inclusive) in one transfer.  The HT1632C
+    // increments the RAM address after every 4 bits so the address only has
+    // to be sent once.  Each column is 16 bits (4 addresses) of RAM, the 4 bits
+    // after the 12 rows of the display are unused and written as zeros.
+    WRdata();
+    CSon();
+    HT1632C_Write(0xa0, 3);
+    HT1632C_Write(com[first] << 1, 7);
+    for (uint8_t col = first; col < last; col++) {
+        HT1632C_Write_Column(data[col] & 0xFFF0, 16);
+    }
+    // The last column can stop after its 12 rows.
+    HT1632C_Write_Column(data[last], 12);
+    CSoff();
+}
+
+#if SINOBIT_DISPLAY_SPI
+static bool HT1632C_SPI_Write_DAT(uint8_t first, uint8_t last, const uint16_t data[])
+{
+    // Same transfer as HT1632C_Write_DAT but with the column data shifted out
+    // by the SPI peripheral.  Returns false without touching the display if the
+    // peripheral is in use.  The 10 bit command and address aren't a whole
+    // number of bytes so they're still bit-banged, and the last column is sent
+    // as a full 16 bits.  SPI mode 3 (clock idles high, data sampled on the
+    // rising edge) matches how the HT1632C latches WR.
+    NRF_SPI_Type *spi = SINOBIT_DISPLAY_SPI_PERIPHERAL;
+    if (spi->ENABLE != 0) {
+        return false;
+    }
+    WRdata();
+    CSon();
+    HT1632C_Write(0xa0, 3);
+    HT1632C_Write(com[first] << 1, 7);
+    spi->PSELSCK = HT_WR;
+    spi->PSELMOSI = HT_DATA;
+    spi->PSELMISO = 0xFFFFFFFF;
+    spi->FREQUENCY = SINOBIT_DISPLAY_SPI_FREQUENCY;
+    spi->CONFIG = (SPI_CONFIG_ORDER_MsbFirst << SPI_CONFIG_ORDER_Pos) |
+                  (SPI_CONFIG_CPHA_Trailing << SPI_CONFIG_CPHA_Pos) |
+                  (SPI_CONFIG_CPOL_ActiveLow << SPI_CONFIG_CPOL_Pos);
+    spi->EVENTS_READY = 0;
+    spi->ENABLE = SPI_ENABLE_ENABLE_Enabled << SPI_ENABLE_ENABLE_Pos;
+    // TXD is double buffered, keep the next byte queued while the current one
+    // is shifting so the clock runs without gaps.
+    uint8_t count = 2*(last-first+1);
+    uint8_t queued = 0;
+    for (uint8_t i = 0; i < count; i++) {
+        while (queued < count && queued < i+2) {
+            uint16_t column = data[first+queued/2] & 0xFFF0;
+            spi->TXD = (queued & 1) ? (column & 0xFF) : (column >> 8);
+            queued++;
+        }
+        while (!spi->EVENTS_READY) {
+        }
+        spi->EVENTS_READY = 0;
+        (void)spi->RXD;
+    }
+    spi->ENABLE = SPI_ENABLE_ENABLE_Disabled << SPI_ENABLE_ENABLE_Pos;
+    spi->PSELSCK = 0xFFFFFFFF;
+    spi->PSELMOSI = 0xFFFFFFFF;
+    bits_shifted += 8*count;
     CSoff();
+    return true;
 }
+#endif
 
 static void HT1632C_clr(void)  //Clear function
 {
@@ -186,10 +328,40 @@ static uint16_t HT1632C_Read_DATA(uint8_t Addr)
     return datum;
 }
 
-static void HT1632C_Write_Pattern(const uint16_t pattern[])
+static void HT1632C_Write_Pattern(const uint16_t pattern[], uint16_t dirty)
 {
-    for (int col = 0; col < 12; col++) {
-        HT1632C_Write_DAT(com[col], pattern, col);
+    // Write the columns with a set bit in the dirty mask (bit 0 is column 0).
+    // Each run of adjacent dirty columns is sent as one burst transfer.  Runs
+    // are split at clean columns since resending the 10 bit command and
+    // address is cheaper than sending a 16 bit column that didn't change.
+    uint8_t col = 0;
+#if SINOBIT_DISPLAY_SPI
+    // Over SPI a column only costs 2 bytes, so send a single burst from the
+    // first to the last dirty column.
+    if (dirty) {
+        uint8_t first = 0;
+        uint8_t last = 11;
+        while (!(dirty & (1 << first))) {
+            first++;
+        }
+        while (!(dirty & (1 << last))) {
+            last--;
+        }
+        if (HT1632C_SPI_Write_DAT(first, last, pattern)) {
+            return;
+        }
+    }
+#endif
+    while (col < 12) {
+        if (!(dirty & (1 << col))) {
+            col++;
+            continue;
+        }
+        uint8_t first = col;
+        while ((col < 12) && (dirty & (1 << col))) {
+            col++;
+        }
+        HT1632C_Write_DAT(first, col-1, pattern);
     }
 }
 
@@ -218,6 +390,10 @@ void framebuffer_set(uint8_t x, uint8_t y, bool value) {
             *column |= mask;
         else
             *column &= ~mask;
+        // Drop any greyscale level the pixel had.
+        for (int k = 0; k < greyscale_bits; ++k) {
+            greyscale_planes[k][y] &= ~mask;
+        }
     }
 }
 
@@ -232,9 +408,233 @@ bool framebuffer_get(uint8_t x, uint8_t y) {
     return pixel;
 }
 
-// Write out the framebuffer data to the display.
-void framebuffer_write() {
-    HT1632C_Write_Pattern(framebuffer);
+// Set a pixel to a level from 0 (off) to framebuffer_levels()-1 (max).
+// Levels above the max are clamped to it.
+void framebuffer_set_level(uint8_t x, uint8_t y, uint8_t level) {
+    uint8_t max = framebuffer_levels()-1;
+    if (level >= max) {
+        framebuffer_set(x, y, true);
+        return;
+    }
+    framebuffer_set(x, y, false);
+    if ((x < 12) && (y < 12)) {
+        uint16_t mask = 0x8000 >> x;
+        for (int k = 0; k < greyscale_bits; ++k) {
+            if (level & (1 << k)) {
+                greyscale_planes[k][y] |= mask;
+            }
+        }
+    }
+}
+
+// Get the level of the pixel at the provided x, y position (0 if invalid).
+uint8_t framebuffer_get_level(uint8_t x, uint8_t y) {
+    if ((x >= 12) || (y >= 12)) {
+        return 0;
+    }
+    if (framebuffer_get(x, y)) {
+        return framebuffer_levels()-1;
+    }
+    uint16_t mask = 0x8000 >> x;
+    uint8_t level = 0;
+    for (int k = 0; k < greyscale_bits; ++k) {
+        if (greyscale_planes[k][y] & mask) {
+            level |= 1 << k;
+        }
+    }
+    return level;
+}
+
+// Get the number of pixel levels, 2 when greyscale is off.
+uint8_t framebuffer_levels() {
+    return 1 << greyscale_bits;
+}
+
+// Request a write of the framebuffer to the display.  The frame is copied to
+// the front buffer and sent by the display tick within the next 6ms, so only
+// the columns that changed (or all of them if full is true) go over the bus.
+// Requests made before the tick are merged and only the latest frame is sent.
+void framebuffer_write(bool full) {
+    if (full) {
+        write_full = true;
+    }
+    if (greyscale_copying) {
+        // A tick (the marquee or microbit.display) interrupted a write that's
+        // copying the frame, leave it to copy again with this change.
+        write_again = true;
+        return;
+    }
+    // Stop the tick from sending a half copied frame if it fires mid copy.
+    write_pending = false;
+    do {
+        write_again = false;
+        greyscale_copying = true;
+        for (int col = 0; col < 12; ++col) {
+            framebuffer_front[col] = framebuffer[col];
+        }
+        for (int k = 0; k < greyscale_bits; ++k) {
+            for (int col = 0; col < 12; ++col) {
+                greyscale_front[k][col] = greyscale_planes[k][col];
+            }
+        }
+        greyscale_copying = false;
+    } while (write_again);
+    write_pending = true;
+}
+
+// Check if a frame is waiting to be sent by the display tick.
+bool framebuffer_write_pending() {
+    return write_pending;
+}
+
+// Send a brightness change if there is one and the columns of frame that
+// differ from what's on the display (or all of them after a full write).
+static void display_send(const uint16_t frame[]) {
+    uint32_t start = us_ticker_read();
+    if (brightness_pending >= 0) {
+        ht1632_brightness(brightness_pending);
+        brightness_pending = -1;
+    }
+    uint16_t dirty = 0;
+    for (int col = 0; col < 12; ++col) {
+        if (frame[col] != framebuffer_sent[col]) {
+            dirty |= 1 << col;
+        }
+    }
+    if (write_full) {
+        dirty = 0xFFF;
+        write_full = false;
+    }
+    if (dirty != 0) {
+        HT1632C_Write_Pattern(frame, dirty);
+        for (int col = 0; col < 12; ++col) {
+            framebuffer_sent[col] = frame[col];
+        }
+    }
+    send_time += us_ticker_read()-start;
+}
+
+// Advance the background text by one column if it's due.
+static void marquee_tick() {
+    sinobit_marquee_t *marquee = MP_STATE_PORT(sinobit_marquee);
+    if (marquee == NULL) {
+        return;
+    }
+    marquee->elapsed += MILLISECONDS_PER_MACRO_TICK;
+    if (marquee->elapsed < marquee->delay) {
+        return;
+    }
+    marquee->elapsed = 0;
+    // Skip the glyphs that are entirely left of the new column.
+    while ((marquee->cursor < marquee->count) &&
+           (marquee->cursor_start+11 <= marquee->offset)) {
+        marquee->cursor_start += marquee->glyphs[marquee->cursor].dwidth;
+        marquee->cursor++;
+    }
+    framebuffer_scroll(0, -1, 0);
+    int start = marquee->cursor_start;
+    for (int i = marquee->cursor; (i < marquee->count) && (start <= marquee->offset); ++i) {
+        const text_glyph_t *glyph = &marquee->glyphs[i];
+        if (glyph->character != NULL) {
+            text_draw_glyph_column(11, marquee->y, glyph->character, marquee->offset-start);
+        }
+        start += glyph->dwidth;
+    }
+    framebuffer_write(false);
+    // Keep going until the end of the message has scrolled off the left edge.
+    marquee->offset++;
+    if (marquee->offset >= marquee->width+12) {
+        if (marquee->loop) {
+            marquee->offset = 0;
+            marquee->cursor = 0;
+            marquee->cursor_start = 0;
+        }
+        else {
+            MP_STATE_PORT(sinobit_marquee) = NULL;
+            marquee_done = true;
+        }
+    }
+}
+
+// Send any pending frame and brightness change to the display.  This is
+// called from the ticker so all display bus traffic after init happens here
+// and Python code never waits on the HT1632C.
+void sinobit_display_tick() {
+    marquee_tick();
+    // In greyscale mode the fast ticker owns the bus.
+    if (greyscale_bits > 1) {
+        return;
+    }
+    if (!write_pending && brightness_pending < 0) {
+        return;
+    }
+    write_pending = false;
+    uint16_t frame[12];
+    for (int col = 0; col < 12; ++col) {
+        frame[col] = framebuffer_front[col];
+    }
+    display_send(frame);
+}
+
+// Fast ticker callback that shows the next greyscale bit plane.  Returns the
+// number of ticks to show it for.
+static int32_t greyscale_ticker(void) {
+    if (greyscale_copying) {
+        // Try again on the next tick rather than show a half copied frame.
+        return 1;
+    }
+    uint8_t plane = greyscale_plane;
+    uint16_t frame[12];
+    for (int col = 0; col < 12; ++col) {
+        frame[col] = framebuffer_front[col] | greyscale_front[plane][col];
+    }
+    write_pending = false;
+    display_send(frame);
+    greyscale_plane = plane+1 < greyscale_bits ? plane+1 : 0;
+    return GREYSCALE_PLANE_TICKS << plane;
+}
+
+// Set the number of pixel levels, a power of two from 2 (no greyscale) to 16.
+// Returns false for an unsupported number of levels.  Changing the levels
+// clears any greyscale pixels but keeps the pixels that are fully on.
+bool framebuffer_set_levels(uint8_t levels) {
+    uint8_t bits = 0;
+    while ((1 << bits) < levels) {
+        bits++;
+    }
+    if ((bits < 1) || (bits > GREYSCALE_MAX_BITS) || ((1 << bits) != levels)) {
+        return false;
+    }
+    // Stop the fast ticker before changing the planes it reads, and only let
+    // the slow tick back on the bus once it's stopped.
+    clear_ticker_callback(GREYSCALE_TICKER_INDEX);
+    for (int k = 0; k < GREYSCALE_MAX_BITS; ++k) {
+        for (int col = 0; col < 12; ++col) {
+            greyscale_planes[k][col] = 0;
+            greyscale_front[k][col] = 0;
+        }
+    }
+    greyscale_plane = 0;
+    greyscale_bits = bits;
+    if (bits > 1) {
+        set_ticker_callback(GREYSCALE_TICKER_INDEX, greyscale_ticker, 0);
+    }
+    else {
+        // Make sure the slow tick puts the plain frame back on the display.
+        write_pending = true;
+    }
+    return true;
+}
+
+// Get the total number of bits clocked out to the display.
+uint32_t framebuffer_bits_shifted() {
+    return bits_shifted;
+}
+
+// Get the total number of microseconds the display tick and greyscale ticker
+// have spent sending to the display.
+uint32_t framebuffer_send_time() {
+    return send_time;
 }
 
 // Set the entire framebuffer with the provided value (true is on, false is off).
@@ -245,25 +645,257 @@ void framebuffer_fill(bool value) {
     for (int i = 0; i < 12; ++i) {
         framebuffer[i] = datum;
     }
+    for (int k = 0; k < greyscale_bits; ++k) {
+        for (int i = 0; i < 12; ++i) {
+            greyscale_planes[k][i] = 0;
+        }
+    }
+}
+
+// Set the pixels of mask in one column to a level.  Column is the y position
+// and mask has bit 15-x set for each x position.
+static void framebuffer_span(int col, uint16_t mask, uint8_t level) {
+    if (level >= framebuffer_levels()-1) {
+        framebuffer[col] |= mask;
+        level = 0;
+    }
+    else {
+        framebuffer[col] &= ~mask;
+    }
+    for (int k = 0; k < greyscale_bits; ++k) {
+        if (level & (1 << k)) {
+            greyscale_planes[k][col] |= mask;
+        }
+        else {
+            greyscale_planes[k][col] &= ~mask;
+        }
+    }
+}
+
+// Fill a width x height rectangle with its top left corner at x, y.  Each
+// column is a single masked word update.  Parts off the display are clipped.
+void framebuffer_fill_rect(int x, int y, int width, int height, uint8_t level) {
+    int x0 = x > 0 ? x : 0;
+    int x1 = x+width < 12 ? x+width : 12;
+    int y0 = y > 0 ? y : 0;
+    int y1 = y+height < 12 ? y+height : 12;
+    if ((x0 >= x1) || (y0 >= y1)) {
+        return;
+    }
+    uint16_t mask = (0xFFFF >> x0) & ~(0xFFFF >> x1);
+    for (int col = y0; col < y1; ++col) {
+        framebuffer_span(col, mask, level);
+    }
+}
+
+// Draw a line width pixels to the right of x, y.
+void framebuffer_hline(int x, int y, int width, uint8_t level) {
+    framebuffer_fill_rect(x, y, width, 1, level);
+}
+
+// Draw a line height pixels down from x, y.
+void framebuffer_vline(int x, int y, int height, uint8_t level) {
+    framebuffer_fill_rect(x, y, 1, height, level);
+}
+
+// Draw a 1 pixel wide outline of a width x height rectangle at x, y.
+void framebuffer_rect(int x, int y, int width, int height, uint8_t level) {
+    if ((width <= 0) || (height <= 0)) {
+        return;
+    }
+    framebuffer_hline(x, y, width, level);
+    framebuffer_hline(x, y+height-1, width, level);
+    framebuffer_vline(x, y, height, level);
+    framebuffer_vline(x+width-1, y, height, level);
+}
+
+// Number of minor axis steps Bresenham's algorithm below has taken after step
+// steps along the major axis of a line.
+static int64_t line_minor_steps(uint64_t step, uint64_t major, uint64_t minor) {
+    return major == 0 ? 0 : (2*step*minor + major-1) / (2*major);
+}
+
+// Draw a line from x0, y0 to x1, y1 (both ends included) with Bresenham's
+// algorithm.  Runs along x are merged into one word update.  Every step moves
+// one pixel along the major axis and the error term only depends on how far
+// the line has got along each axis, so only the steps where the major axis is
+// on the display are walked and a long line costs no more than a short one.
+// Coordinates are expected to fit in a small int (31 bits).
+void framebuffer_line(int x0, int y0, int x1, int y1, uint8_t level) {
+    int64_t dx = x1 > x0 ? (int64_t)x1-x0 : (int64_t)x0-x1;
+    int64_t dy = y1 > y0 ? (int64_t)y1-y0 : (int64_t)y0-y1;
+    int sx = x0 < x1 ? 1 : -1;
+    int sy = y0 < y1 ? 1 : -1;
+    // Clip the major axis to the display.
+    bool x_major = dx >= dy;
+    int64_t major = x_major ? dx : dy;
+    int64_t minor = x_major ? dy : dx;
+    int64_t m0 = x_major ? x0 : y0;
+    int64_t first_step = (x_major ? sx : sy) > 0 ? -m0 : m0-11;
+    int64_t last_step = (x_major ? sx : sy) > 0 ? 11-m0 : m0;
+    if (first_step < 0) {
+        first_step = 0;
+    }
+    if (last_step > major) {
+        last_step = major;
+    }
+    if (first_step > last_step) {
+        return;
+    }
+    int64_t first_minor = line_minor_steps(first_step, major, minor);
+    int64_t last_minor = line_minor_steps(last_step, major, minor);
+    int64_t steps_x = x_major ? first_step : first_minor;
+    int64_t steps_y = x_major ? first_minor : first_step;
+    int64_t err = dx-dy + steps_y*dx - steps_x*dy;
+    x0 += sx*steps_x;
+    y0 += sy*steps_y;
+    x1 = x0 + sx*((x_major ? last_step : last_minor) - steps_x);
+    y1 = y0 + sy*((x_major ? last_minor : last_step) - steps_y);
+    int run_start = x0;
+    while (true) {
+        // The major axis moves every step so it alone says when to stop.
+        bool done = x_major ? x0 == x1 : y0 == y1;
+        int64_t e2 = 2*err;
+        bool step_y = !done && (e2 < dx);
+        if (done || step_y) {
+            // End of a run of pixels in this column.
+            int first = run_start < x0 ? run_start : x0;
+            int last = run_start < x0 ? x0 : run_start;
+            framebuffer_hline(first, y0, last-first+1, level);
+        }
+        if (done) {
+            break;
+        }
+        if (e2 > -dy) {
+            err -= dy;
+            x0 += sx;
+        }
+        if (step_y) {
+            err += dx;
+            y0 += sy;
+            run_start = x0;
+        }
+    }
+}
+
+// Shift every column word in place dx pixels right (towards higher x) and dy
+// pixels down (towards higher y), which is the column index.  Pixels shifted
+// off the display are lost and the uncovered area is set to the fill level.
+static void shift_columns(uint16_t columns[], int dx, int dy) {
+    for (int i = 0; i < 12; ++i) {
+        int col = dy > 0 ? 11-i : i;
+        int src = col-dy;
+        uint16_t word = 0;
+        if ((src >= 0) && (src < 12) && (dx > -12) && (dx < 12)) {
+            word = columns[src] & 0xFFF0;
+            word = dx >= 0 ? word >> dx : word << -dx;
+        }
+        columns[col] = word & 0xFFF0;
+    }
+}
+
+void framebuffer_scroll(int dx, int dy, uint8_t fill) {
+    shift_columns(framebuffer, dx, dy);
+    for (int k = 0; k < greyscale_bits; ++k) {
+        shift_columns(greyscale_planes[k], dx, dy);
+    }
+    if (fill == 0) {
+        return;
+    }
+    if (dx > 0) {
+        framebuffer_fill_rect(0, 0, dx, 12, fill);
+    }
+    else if (dx < 0) {
+        framebuffer_fill_rect(12+dx, 0, -dx, 12, fill);
+    }
+    if (dy > 0) {
+        framebuffer_fill_rect(0, 0, 12, dy, fill);
+    }
+    else if (dy < 0) {
+        framebuffer_fill_rect(0, 12+dy, 12, -dy, fill);
+    }
+}
+
+// Copy columns in the native framebuffer format (one little-endian 16 bit word
+// per column, row y at bit 15-y) to the framebuffer with the first pixel at
+// x, y.  Only the area covered by the source is replaced, anything that falls
+// outside the display is dropped, so a strip of columns wider than the display
+// can be drawn from any column by using a negative y.
+void framebuffer_blit(const uint8_t *buffer, size_t columns, int x, int y) {
+    if ((x <= -12) || (x >= 12) || (y >= 12) || (y <= -(int)columns)) {
+        return;
+    }
+    uint16_t mask = (x >= 0 ? 0xFFF0 >> x : 0xFFF0 << -x) & 0xFFF0;
+    // Only the source columns that land on the display, compared as signed
+    // so a y past the bottom can't wrap around to a huge count.
+    int first = y < 0 ? -y : 0;
+    int last = 12-y;
+    if (last > (int)columns) {
+        last = columns;
+    }
+    if (first >= last) {
+        return;
+    }
+    for (int col = first; col < last; ++col) {
+        int dst = y+col;
+        uint16_t word = (buffer[2*col] | (buffer[2*col+1] << 8)) & 0xFFF0;
+        word = x >= 0 ? word >> x : word << -x;
+        framebuffer[dst] = (framebuffer[dst] & ~mask) | (word & mask);
+        for (int k = 0; k < greyscale_bits; ++k) {
+            greyscale_planes[k][dst] &= ~mask;
+        }
+    }
 }
 
 // Initialize the display hardware.
 void sinobit_display_init() {
+    // Stop any greyscale refresh left running from before a soft reboot.
+    clear_ticker_callback(GREYSCALE_TICKER_INDEX);
+    greyscale_bits = 1;
+    // Stop the display tick from sending anything in the middle of the init
+    // commands below.
+    MP_STATE_PORT(sinobit_marquee) = NULL;
+    write_pending = false;
+    write_full = false;
+    write_again = false;
+    brightness_pending = -1;
     HT1632C_Init();
     // Clear the screen.
     HT1632C_clr();
     framebuffer_fill(false);
+    for (int col = 0; col < 12; ++col) {
+        framebuffer_sent[col] = 0;
+        framebuffer_front[col] = 0;
+    }
 }
 
 // These are the functions exposed by the module to Python code.  See the
 // locals table macro at the bottom for how these map to QSTR names.
+// Convert a color to a pixel level.  In greyscale mode an int is a level from
+// 0 to levels-1, anything else (and any value without greyscale) is on or off
+// by whether it's true like set_pixel has always taken it.
+STATIC uint8_t sinobit_display_color_level(mp_obj_t c) {
+    if (!MP_OBJ_IS_SMALL_INT(c) || (framebuffer_levels() == 2)) {
+        return mp_obj_is_true(c) ? framebuffer_levels()-1 : 0;
+    }
+    mp_int_t level = MP_OBJ_SMALL_INT_VALUE(c);
+    if (level < 0) {
+        return 0;
+    }
+    return level > 255 ? 255 : level;
+}
+
 STATIC mp_obj_t sinobit_display_set_pixel(mp_obj_t x, mp_obj_t y, mp_obj_t c) {
-    framebuffer_set(mp_obj_get_int(x), mp_obj_get_int(y), mp_obj_is_true(c));
+    framebuffer_set_level(mp_obj_get_int(x), mp_obj_get_int(y), sinobit_display_color_level(c));
     return mp_const_none;
 }
 MP_DEFINE_CONST_FUN_OBJ_3(sinobitdisplay_set_pixel_obj, sinobit_display_set_pixel);
 
 STATIC mp_obj_t sinobit_display_get_pixel(mp_obj_t x, mp_obj_t y) {
+    // Without greyscale keep returning a bool.
+    if (framebuffer_levels() > 2) {
+        return MP_OBJ_NEW_SMALL_INT(framebuffer_get_level(mp_obj_get_int(x), mp_obj_get_int(y)));
+    }
     if (framebuffer_get(mp_obj_get_int(x), mp_obj_get_int(y))) {
         return mp_const_true;
     }
@@ -273,11 +905,199 @@ STATIC mp_obj_t sinobit_display_get_pixel(mp_obj_t x, mp_obj_t y) {
 }
 MP_DEFINE_CONST_FUN_OBJ_2(sinobitdisplay_get_pixel_obj, sinobit_display_get_pixel);
 
-STATIC mp_obj_t sinobit_display_write() {
-    framebuffer_write();
+STATIC mp_obj_t sinobit_display_levels(mp_uint_t n_args, const mp_obj_t *args) {
+    if (n_args > 0) {
+        mp_int_t levels = mp_obj_get_int(args[0]);
+        if ((levels < 0) || (levels > 255) || !framebuffer_set_levels(levels)) {
+            nlr_raise(mp_obj_new_exception_msg(&mp_type_ValueError, "levels must be 2, 4, 8 or 16"));
+        }
+    }
+    return MP_OBJ_NEW_SMALL_INT(framebuffer_levels());
+}
+MP_DEFINE_CONST_FUN_OBJ_VAR_BETWEEN(sinobitdisplay_levels_obj, 0, 1, sinobit_display_levels);
+
+STATIC mp_obj_t sinobit_display_write(mp_uint_t n_args, const mp_obj_t *pos_args, mp_map_t *kw_args) {
+    static const mp_arg_t write_allowed_args[] = {
+        { MP_QSTR_full, MP_ARG_BOOL, {.u_bool = false} },
+        { MP_QSTR_wait, MP_ARG_KW_ONLY | MP_ARG_BOOL, {.u_bool = false} },
+    };
+    mp_arg_val_t args[MP_ARRAY_SIZE(write_allowed_args)];
+    mp_arg_parse_all(n_args, pos_args, kw_args, MP_ARRAY_SIZE(write_allowed_args), write_allowed_args, args);
+    framebuffer_write(args[0].u_bool);
+    if (args[1].u_bool) {
+        // Block until the tick has sent the frame, at most one tick.
+        while (framebuffer_write_pending()) {
+            __WFI();
+        }
+    }
+    return mp_const_none;
+}
+MP_DEFINE_CONST_FUN_OBJ_KW(sinobitdisplay_write_obj, 0, sinobit_display_write);
+
+// The drawing functions take an optional color that defaults to on.
+STATIC mp_obj_t sinobit_display_hline(mp_uint_t n_args, const mp_obj_t *args) {
+    uint8_t level = n_args > 3 ? sinobit_display_color_level(args[3]) : framebuffer_levels()-1;
+    framebuffer_hline(mp_obj_get_int(args[0]), mp_obj_get_int(args[1]), mp_obj_get_int(args[2]), level);
+    return mp_const_none;
+}
+MP_DEFINE_CONST_FUN_OBJ_VAR_BETWEEN(sinobitdisplay_hline_obj, 3, 4, sinobit_display_hline);
+
+STATIC mp_obj_t sinobit_display_vline(mp_uint_t n_args, const mp_obj_t *args) {
+    uint8_t level = n_args > 3 ? sinobit_display_color_level(args[3]) : framebuffer_levels()-1;
+    framebuffer_vline(mp_obj_get_int(args[0]), mp_obj_get_int(args[1]), mp_obj_get_int(args[2]), level);
+    return mp_const_none;
+}
+MP_DEFINE_CONST_FUN_OBJ_VAR_BETWEEN(sinobitdisplay_vline_obj, 3, 4, sinobit_display_vline);
+
+STATIC mp_obj_t sinobit_display_rect(mp_uint_t n_args, const mp_obj_t *args) {
+    uint8_t level = n_args > 4 ? sinobit_display_color_level(args[4]) : framebuffer_levels()-1;
+    framebuffer_rect(mp_obj_get_int(args[0]), mp_obj_get_int(args[1]),
+                     mp_obj_get_int(args[2]), mp_obj_get_int(args[3]), level);
+    return mp_const_none;
+}
+MP_DEFINE_CONST_FUN_OBJ_VAR_BETWEEN(sinobitdisplay_rect_obj, 4, 5, sinobit_display_rect);
+
+STATIC mp_obj_t sinobit_display_fill_rect(mp_uint_t n_args, const mp_obj_t *args) {
+    uint8_t level = n_args > 4 ? sinobit_display_color_level(args[4]) : framebuffer_levels()-1;
+    framebuffer_fill_rect(mp_obj_get_int(args[0]), mp_obj_get_int(args[1]),
+                          mp_obj_get_int(args[2]), mp_obj_get_int(args[3]), level);
+    return mp_const_none;
+}
+MP_DEFINE_CONST_FUN_OBJ_VAR_BETWEEN(sinobitdisplay_fill_rect_obj, 4, 5, sinobit_display_fill_rect);
+
+STATIC mp_obj_t sinobit_display_line(mp_uint_t n_args, const mp_obj_t *args) {
+    uint8_t level = n_args > 4 ? sinobit_display_color_level(args[4]) : framebuffer_levels()-1;
+    framebuffer_line(mp_obj_get_int(args[0]), mp_obj_get_int(args[1]),
+                     mp_obj_get_int(args[2]), mp_obj_get_int(args[3]), level);
+    return mp_const_none;
+}
+MP_DEFINE_CONST_FUN_OBJ_VAR_BETWEEN(sinobitdisplay_line_obj, 4, 5, sinobit_display_line);
+
+STATIC mp_obj_t sinobit_display_scroll(mp_uint_t n_args, const mp_obj_t *pos_args, mp_map_t *kw_args) {
+    static const mp_arg_t scroll_allowed_args[] = {
+        { MP_QSTR_dx, MP_ARG_REQUIRED | MP_ARG_INT, {.u_int = 0} },
+        { MP_QSTR_dy, MP_ARG_REQUIRED | MP_ARG_INT, {.u_int = 0} },
+        { MP_QSTR_fill, MP_ARG_OBJ, {.u_obj = mp_const_false} },
+    };
+    mp_arg_val_t args[MP_ARRAY_SIZE(scroll_allowed_args)];
+    mp_arg_parse_all(n_args, pos_args, kw_args, MP_ARRAY_SIZE(scroll_allowed_args), scroll_allowed_args, args);
+    framebuffer_scroll(args[0].u_int, args[1].u_int, sinobit_display_color_level(args[2].u_obj));
+    return mp_const_none;
+}
+MP_DEFINE_CONST_FUN_OBJ_KW(sinobitdisplay_scroll_obj, 2, sinobit_display_scroll);
+
+STATIC mp_obj_t sinobit_display_ticker(mp_uint_t n_args, const mp_obj_t *args) {
+    // Move the display one text column to the left and draw the column of the
+    // message at the given offset from its start on the right edge.  Calling
+    // this with offsets counting up from 0 scrolls the message in from the
+    // right while only drawing one new column each step.
+    mp_int_t y = n_args > 2 ? mp_obj_get_int(args[2]) : 0;
+    framebuffer_scroll(0, -1, 0);
+    text_draw_column(11, y, args[0], mp_obj_get_int(args[1]));
     return mp_const_none;
 }
-MP_DEFINE_CONST_FUN_OBJ_0(sinobitdisplay_write_obj, sinobit_display_write);
+MP_DEFINE_CONST_FUN_OBJ_VAR_BETWEEN(sinobitdisplay_ticker_obj, 2, 3, sinobit_display_ticker);
+
+STATIC mp_obj_t sinobit_display_scroll_text(mp_uint_t n_args, const mp_obj_t *pos_args, mp_map_t *kw_args) {
+    static const mp_arg_t scroll_text_allowed_args[] = {
+        { MP_QSTR_text, MP_ARG_REQUIRED | MP_ARG_OBJ, {.u_obj = MP_OBJ_NULL} },
+        { MP_QSTR_delay, MP_ARG_INT, {.u_int = 100} },
+        { MP_QSTR_wait, MP_ARG_KW_ONLY | MP_ARG_BOOL, {.u_bool = false} },
+        { MP_QSTR_loop, MP_ARG_KW_ONLY | MP_ARG_BOOL, {.u_bool = false} },
+        { MP_QSTR_y, MP_ARG_KW_ONLY | MP_ARG_INT, {.u_int = 0} },
+    };
+    mp_arg_val_t args[MP_ARRAY_SIZE(scroll_text_allowed_args)];
+    mp_arg_parse_all(n_args, pos_args, kw_args, MP_ARRAY_SIZE(scroll_text_allowed_args), scroll_text_allowed_args, args);
+    // Stop any text that's already scrolling, None just stops it.
+    MP_STATE_PORT(sinobit_marquee) = NULL;
+    mp_obj_t text = args[0].u_obj;
+    if (text == mp_const_none) {
+        return mp_const_none;
+    }
+    if (!MP_OBJ_IS_STR(text)) {
+        nlr_raise(mp_obj_new_exception_msg(&mp_type_TypeError, "text must be a string"));
+    }
+    size_t count = text_glyphs(text, NULL);
+    sinobit_marquee_t *marquee = m_new_obj_var(sinobit_marquee_t, text_glyph_t, count);
+    text_glyphs(text, marquee->glyphs);
+    marquee->count = count;
+    marquee->width = 0;
+    for (size_t i = 0; i < count; ++i) {
+        marquee->width += marquee->glyphs[i].dwidth;
+    }
+    marquee->delay = args[1].u_int < 0 ? 0 : args[1].u_int;
+    marquee->elapsed = marquee->delay;
+    marquee->offset = 0;
+    marquee->cursor = 0;
+    marquee->cursor_start = 0;
+    marquee->y = args[4].u_int;
+    marquee->loop = args[3].u_bool;
+    marquee_done = false;
+    // Start it only once it's all set up since the tick can run at any time.
+    MP_STATE_PORT(sinobit_marquee) = marquee;
+    if (args[2].u_bool) {
+        while (!marquee_done) {
+            // Allow CTRL-C to stop the text.
+            if (MP_STATE_VM(mp_pending_exception) != MP_OBJ_NULL) {
+                MP_STATE_PORT(sinobit_marquee) = NULL;
+                break;
+            }
+            __WFI();
+        }
+    }
+    return mp_const_none;
+}
+MP_DEFINE_CONST_FUN_OBJ_KW(sinobitdisplay_scroll_text_obj, 1, sinobit_display_scroll_text);
+
+STATIC mp_obj_t sinobit_display_blit(mp_uint_t n_args, const mp_obj_t *pos_args, mp_map_t *kw_args) {
+    static const mp_arg_t blit_allowed_args[] = {
+        { MP_QSTR_buffer, MP_ARG_REQUIRED | MP_ARG_OBJ, {.u_obj = MP_OBJ_NULL} },
+        { MP_QSTR_x, MP_ARG_INT, {.u_int = 0} },
+        { MP_QSTR_y, MP_ARG_INT, {.u_int = 0} },
+    };
+    mp_arg_val_t args[MP_ARRAY_SIZE(blit_allowed_args)];
+    mp_arg_parse_all(n_args, pos_args, kw_args, MP_ARRAY_SIZE(blit_allowed_args), blit_allowed_args, args);
+    mp_buffer_info_t bufinfo;
+    mp_get_buffer_raise(args[0].u_obj, &bufinfo, MP_BUFFER_READ);
+    if (bufinfo.len & 1) {
+        nlr_raise(mp_obj_new_exception_msg(&mp_type_ValueError, "buffer must be columns of 2 bytes"));
+    }
+    framebuffer_blit((const uint8_t*)bufinfo.buf, bufinfo.len/2, args[1].u_int, args[2].u_int);
+    return mp_const_none;
+}
+MP_DEFINE_CONST_FUN_OBJ_KW(sinobitdisplay_blit_obj, 1, sinobit_display_blit);
+
+STATIC mp_obj_t sinobit_display_get_buffer() {
+    // A view of the framebuffer memory itself, so changes made through it
+    // show up on the next write.
+    return mp_obj_new_bytearray_by_ref(sizeof(framebuffer), framebuffer);
+}
+MP_DEFINE_CONST_FUN_OBJ_0(sinobitdisplay_get_buffer_obj, sinobit_display_get_buffer);
+
+STATIC mp_obj_t sinobit_display_prepare_text(mp_obj_t text) {
+    // Render text once into a bytearray of columns in the blit format.  Draw
+    // it with blit(strip, y, -offset) to show it from column offset, which is
+    // a column copy with no string decoding or font lookups.
+    if (!MP_OBJ_IS_STR(text)) {
+        nlr_raise(mp_obj_new_exception_msg(&mp_type_TypeError, "text must be a string"));
+    }
+    size_t columns = text_width(text);
+    byte *strip = m_new(byte, 2*columns);
+    memset(strip, 0, 2*columns);
+    text_render_columns(text, strip, columns);
+    return mp_obj_new_bytearray_by_ref(2*columns, strip);
+}
+MP_DEFINE_CONST_FUN_OBJ_1(sinobitdisplay_prepare_text_obj, sinobit_display_prepare_text);
+
+STATIC mp_obj_t sinobit_display_bits_shifted() {
+    return mp_obj_new_int_from_uint(framebuffer_bits_shifted());
+}
+MP_DEFINE_CONST_FUN_OBJ_0(sinobitdisplay_bits_shifted_obj, sinobit_display_bits_shifted);
+
+STATIC mp_obj_t sinobit_display_send_time() {
+    return mp_obj_new_int_from_uint(framebuffer_send_time());
+}
+MP_DEFINE_CONST_FUN_OBJ_0(sinobitdisplay_send_time_obj, sinobit_display_send_time);
 
 STATIC mp_obj_t sinobit_display_fill(mp_obj_t c) {
     framebuffer_fill(mp_obj_is_true(c));
@@ -292,7 +1112,9 @@ STATIC mp_obj_t sinobit_display_clear() {
 MP_DEFINE_CONST_FUN_OBJ_0(sinobitdisplay_clear_obj, sinobit_display_clear);
 
 STATIC mp_obj_t sinobit_display_brightness(mp_obj_t brightness) {
-    ht1632_brightness(mp_obj_get_int(brightness));
+    // Clamp here, the command is sent by the display tick.
+    mp_int_t value = mp_obj_get_int(brightness);
+    brightness_pending = value < 0 ? 0 : (value > 15 ? 15 : value);
     return mp_const_none;
 }
 MP_DEFINE_CONST_FUN_OBJ_1(sinobitdisplay_brightness_obj, sinobit_display_brightness);
@@ -308,16 +1130,49 @@ STATIC mp_obj_t sinobit_display_text_width(mp_obj_t string) {
 }
 MP_DEFINE_CONST_FUN_OBJ_1(sinobitdisplay_text_width_obj, sinobit_display_text_width);
 
+STATIC mp_obj_t sinobit_display_glyph_cache_stats() {
+    uint32_t hits, misses;
+    text_glyph_cache_stats(&hits, &misses);
+    mp_obj_t stats[2] = {
+        mp_obj_new_int_from_uint(hits),
+        mp_obj_new_int_from_uint(misses),
+    };
+    return mp_obj_new_tuple(2, stats);
+}
+MP_DEFINE_CONST_FUN_OBJ_0(sinobitdisplay_glyph_cache_stats_obj, sinobit_display_glyph_cache_stats);
+
+STATIC mp_obj_t sinobit_display_glyph_cache_reset() {
+    text_glyph_cache_reset();
+    return mp_const_none;
+}
+MP_DEFINE_CONST_FUN_OBJ_0(sinobitdisplay_glyph_cache_reset_obj, sinobit_display_glyph_cache_reset);
+
 STATIC const mp_map_elem_t sinobitdisplay_module_globals_table[] = {
     { MP_OBJ_NEW_QSTR(MP_QSTR___name__), MP_OBJ_NEW_QSTR(MP_QSTR_display) },
     { MP_OBJ_NEW_QSTR(MP_QSTR_set_pixel), (mp_obj_t)&sinobitdisplay_set_pixel_obj },
     { MP_OBJ_NEW_QSTR(MP_QSTR_get_pixel), (mp_obj_t)&sinobitdisplay_get_pixel_obj },
+    { MP_OBJ_NEW_QSTR(MP_QSTR_levels), (mp_obj_t)&sinobitdisplay_levels_obj },
     { MP_OBJ_NEW_QSTR(MP_QSTR_write), (mp_obj_t)&sinobitdisplay_write_obj },
+    { MP_OBJ_NEW_QSTR(MP_QSTR_hline), (mp_obj_t)&sinobitdisplay_hline_obj },
+    { MP_OBJ_NEW_QSTR(MP_QSTR_vline), (mp_obj_t)&sinobitdisplay_vline_obj },
+    { MP_OBJ_NEW_QSTR(MP_QSTR_rect), (mp_obj_t)&sinobitdisplay_rect_obj },
+    { MP_OBJ_NEW_QSTR(MP_QSTR_fill_rect), (mp_obj_t)&sinobitdisplay_fill_rect_obj },
+    { MP_OBJ_NEW_QSTR(MP_QSTR_line), (mp_obj_t)&sinobitdisplay_line_obj },
+    { MP_OBJ_NEW_QSTR(MP_QSTR_scroll), (mp_obj_t)&sinobitdisplay_scroll_obj },
+    { MP_OBJ_NEW_QSTR(MP_QSTR_ticker), (mp_obj_t)&sinobitdisplay_ticker_obj },
+    { MP_OBJ_NEW_QSTR(MP_QSTR_scroll_text), (mp_obj_t)&sinobitdisplay_scroll_text_obj },
+    { MP_OBJ_NEW_QSTR(MP_QSTR_blit), (mp_obj_t)&sinobitdisplay_blit_obj },
+    { MP_OBJ_NEW_QSTR(MP_QSTR_get_buffer), (mp_obj_t)&sinobitdisplay_get_buffer_obj },
+    { MP_OBJ_NEW_QSTR(MP_QSTR_prepare_text), (mp_obj_t)&sinobitdisplay_prepare_text_obj },
+    { MP_OBJ_NEW_QSTR(MP_QSTR_bits_shifted), (mp_obj_t)&sinobitdisplay_bits_shifted_obj },
+    { MP_OBJ_NEW_QSTR(MP_QSTR_send_time), (mp_obj_t)&sinobitdisplay_send_time_obj },
     { MP_OBJ_NEW_QSTR(MP_QSTR_fill), (mp_obj_t)&sinobitdisplay_fill_obj },
     { MP_OBJ_NEW_QSTR(MP_QSTR_clear), (mp_obj_t)&sinobitdisplay_clear_obj },
     { MP_OBJ_NEW_QSTR(MP_QSTR_brightness), (mp_obj_t)&sinobitdisplay_brightness_obj },
     { MP_OBJ_NEW_QSTR(MP_QSTR_text), (mp_obj_t)&sinobitdisplay_text_obj },
     { MP_OBJ_NEW_QSTR(MP_QSTR_text_width), (mp_obj_t)&sinobitdisplay_text_width_obj },
+    { MP_OBJ_NEW_QSTR(MP_QSTR_glyph_cache_stats), (mp_obj_t)&sinobitdisplay_glyph_cache_stats_obj },
+    { MP_OBJ_NEW_QSTR(MP_QSTR_glyph_cache_reset), (mp_obj_t)&sinobitdisplay_glyph_cache_reset_obj },
 };
 
 STATIC MP_DEFINE_CONST_DICT(sinobitdisplay_module_globals, sinobitdisplay_module_globals_table);
@@ -32,25 +32,138 @@ extern "C" {
 #include "sinobitdisplay.h"
 #include "zpixfont.h"
 
+// Number of glyphs kept in the glyph lookup cache.
+#define GLYPH_CACHE_SLOTS (16)
+
+// Small cache of recently used glyphs so drawing the same text over and over
+// (like when scrolling a message) doesn't have to search the font for each
+// character every time.  When the cache is full the least recently used
+// entry is replaced.
+typedef struct {
+  unichar encoding;
+  const zpixfont_character_t* character;  // NULL if not in the font.
+  uint8_t dwidth;
+  uint32_t last_used;                     // 0 if the slot is empty.
+} glyph_cache_entry_t;
+
+static glyph_cache_entry_t glyph_cache[GLYPH_CACHE_SLOTS];
+static uint32_t glyph_cache_clock = 0;
+static uint32_t glyph_cache_hits = 0;
+static uint32_t glyph_cache_misses = 0;
+
+// Where text_draw_column got to in the string it last drew: pos is the first
+// character that can still cover the last offset drawn and start is its
+// column.  The string is identified by its data, length and hash.
+static struct {
+  const uint8_t* data;
+  size_t len;
+  mp_uint_t hash;
+  const uint8_t* pos;
+  int start;
+  int offset;
+} column_cursor;
+
+static const glyph_cache_entry_t* find_glyph(unichar encoding) {
+  // Find the glyph for the specified encoding, either in the cache or in the
+  // font (in which case it's added to the cache).
+  glyph_cache_entry_t* oldest = &glyph_cache[0];
+  ++glyph_cache_clock;
+  for (int i=0; i<GLYPH_CACHE_SLOTS; ++i) {
+    glyph_cache_entry_t* entry = &glyph_cache[i];
+    if ((entry->last_used != 0) && (entry->encoding == encoding)) {
+      entry->last_used = glyph_cache_clock;
+      ++glyph_cache_hits;
+      return entry;
+    }
+    if (entry->last_used < oldest->last_used) {
+      oldest = entry;
+    }
+  }
+  // Not cached, look up the character and replace the oldest entry.
+  ++glyph_cache_misses;
+  oldest->encoding = encoding;
+  oldest->character = zpixfont_find_character(encoding);
+  if (oldest->character != NULL) {
+    oldest->dwidth = zpixfont_char_dwidth(oldest->character);
+  }
+  else {
+    // TODO: Handle character not found by rendering a box or similar
+    // missing character.  For now just skip 11 pixels.
+    oldest->dwidth = 11;
+  }
+  oldest->last_used = glyph_cache_clock;
+  return oldest;
+}
+
+void text_glyph_cache_stats(uint32_t* hits, uint32_t* misses) {
+  *hits = glyph_cache_hits;
+  *misses = glyph_cache_misses;
+}
+
+void text_glyph_cache_reset() {
+  // Empty the glyph cache and reset its hit and miss counters.
+  for (int i=0; i<GLYPH_CACHE_SLOTS; ++i) {
+    glyph_cache[i].last_used = 0;
+  }
+  glyph_cache_clock = 0;
+  glyph_cache_hits = 0;
+  glyph_cache_misses = 0;
+}
 
 static void draw_char(int x0, int y0, const zpixfont_character_t* character) {
   // Draw the specified character at an x, y location on the framebuffer.
-  for (int y=0; y<11; ++y) {
-    for (int x=0; x<11; ++x) {
-      uint8_t byte_index = (y*11+x) / 8;
-      uint8_t byte_offset = 7-((y*11+x) % 8);
-      if ((character->data[byte_index] & (1 << byte_offset)) > 0) {
-        // Draw pixels for the character.  Note the character x/y axes are
-        // swapped to draw on the sinobit display correctly.
-        framebuffer_set(y0+y, x0+x, true);
+  // Note the character x/y axes are swapped to draw on the sinobit display
+  // correctly, i.e. each character column x is the framebuffer column x0+x
+  // and character row y is bit (15 - (y0+y)) of that framebuffer column.
+  // Skip characters that don't touch the 12x12 display at all.
+  if ((x0 >= 12) || (x0+11 <= 0) || (y0 >= 12) || (y0+11 <= 0)) {
+    return;
+  }
+  // Clip the character columns and rows to the display.
+  int first_x = (x0 < 0) ? -x0 : 0;
+  int last_x = (x0+11 > 12) ? 12-x0 : 11;
+  int first_y = (y0 < 0) ? -y0 : 0;
+  int last_y = (y0+11 > 12) ? 12-y0 : 11;
+  // Turn the 11 bit rows of the character into columns in the framebuffer
+  // column format (row y of the character in bit 15-y).
+  uint16_t columns[11] = {0};
+  for (int y=first_y; y<last_y; ++y) {
+    uint16_t row = (zpixfont_char_row(character, y) << first_x) & 0x7FF;
+    uint16_t bit = 0x8000 >> y;
+    for (int x=first_x; row != 0; ++x) {
+      if (row & 0x400) {
+        columns[x] |= bit;
       }
+      row = (row << 1) & 0x7FF;
+    }
+  }
+  // OR each visible column into the framebuffer in one step, shifted down to
+  // the y position of the character.
+  for (int x=first_x; x<last_x; ++x) {
+    if (y0 >= 0) {
+      framebuffer[x0+x] |= columns[x] >> y0;
+    }
+    else {
+      framebuffer[x0+x] |= columns[x] << -y0;
+    }
+  }
+}
+
+static uint16_t char_column(const zpixfont_character_t* character, int x) {
+  // Get column x (0-10) of a character in the framebuffer column format.
+  uint16_t column = 0;
+  uint16_t mask = 0x400 >> x;
+  for (int y=0; y<11; ++y) {
+    if (zpixfont_char_row(character, y) & mask) {
+      column |= 0x8000 >> y;
     }
   }
+  return column;
 }
 
 void text_draw_char(int x0, int y0, uint16_t encoding) {
   // Find the character and display it on the framebuffer.
-  const zpixfont_character_t* character = zpixfont_find_character(encoding);
+  const zpixfont_character_t* character = find_glyph(encoding)->character;
   if (character == NULL) {
     return;
   }
@@ -59,46 +172,148 @@ void text_draw_char(int x0, int y0, uint16_t encoding) {
 
 void text_draw_string(int x0, int y0, mp_obj_t string) {
   // Go through each character in the string and draw it starting at the
-  // specified x, y location.
+  // specified x, y location.  The string is walked once up to its end, and
+  // decoding stops as soon as the next character would start past the right
+  // edge of the 12x12 display since nothing after it can be visible.
   int x = x0;
   GET_STR_DATA_LEN(string, data, len);
   const uint8_t* s = data;
-  for (unsigned int i=0; i<unichar_charlen((const char *)data, len); ++i) {
+  const uint8_t* end = data + len;
+  while ((s < end) && (x < 12)) {
     unichar encoding = utf8_get_char(s);
     // Find the character.
-    const zpixfont_character_t* character = zpixfont_find_character(encoding);
-    if (character != NULL) {
-      // Draw the character and advance to draw next character after the
-      // width of this one.
-      draw_char(x, y0, character);
-      x += zpixfont_char_dwidth(character);
+    const glyph_cache_entry_t* glyph = find_glyph(encoding);
+    if ((glyph->character != NULL) && (x + 11 > 0)) {
+      // Draw the character if any of it might be visible.
+      draw_char(x, y0, glyph->character);
     }
-    else {
-      // TODO: Handle character not found by rendering a box or similar
-      // missing character.  For now just skip 11 pixels.
-      x += 11;
+    // Advance to draw next character after the width of this one.
+    x += glyph->dwidth;
+    s = utf8_next_char(s);
+  }
+}
+
+void text_draw_glyph_column(int x, int y0, const zpixfont_character_t* character, int gx) {
+  // OR column gx (0-10) of a character onto framebuffer column x, shifted down
+  // to the y position and dropping rows below the display.
+  if ((x < 0) || (x >= 12) || (gx < 0) || (gx >= 11) || (y0 >= 12) || (y0+11 <= 0)) {
+    return;
+  }
+  uint16_t column = char_column(character, gx);
+  if (y0 >= 0) {
+    framebuffer[x] |= (column >> y0) & 0xFFF0;
+  }
+  else {
+    framebuffer[x] |= (column << -y0) & 0xFFF0;
+  }
+}
+
+void text_draw_column(int x, int y0, mp_obj_t string, int offset) {
+  // Draw just column offset of the string (counted from the left edge of its
+  // first character) on framebuffer column x, as if the whole string had been
+  // drawn with text_draw_string at x-offset.  Characters can be wider than
+  // their advance width so every character that covers the column is drawn.
+  // Drawing the same string again at the same or a later offset carries on
+  // from where the last call left off, so scrolling through a string one
+  // column at a time costs the same at every step.
+  if (offset < 0) {
+    return;
+  }
+  GET_STR_DATA_LEN(string, data, len);
+  GET_STR_HASH(string, hash);
+  if ((data != column_cursor.data) || (len != column_cursor.len) ||
+      (hash != column_cursor.hash) || (offset < column_cursor.offset)) {
+    column_cursor.data = data;
+    column_cursor.len = len;
+    column_cursor.hash = hash;
+    column_cursor.pos = data;
+    column_cursor.start = 0;
+  }
+  column_cursor.offset = offset;
+  const uint8_t* end = data + len;
+  // Skip the characters that are entirely left of the column.
+  while ((column_cursor.pos < end) && (column_cursor.start+11 <= offset)) {
+    column_cursor.start += find_glyph(utf8_get_char(column_cursor.pos))->dwidth;
+    column_cursor.pos = utf8_next_char(column_cursor.pos);
+  }
+  int start = column_cursor.start;
+  const uint8_t* s = column_cursor.pos;
+  while ((s < end) && (start <= offset)) {
+    const glyph_cache_entry_t* glyph = find_glyph(utf8_get_char(s));
+    if (glyph->character != NULL) {
+      text_draw_glyph_column(x, y0, glyph->character, offset-start);
     }
+    start += glyph->dwidth;
+    s = utf8_next_char(s);
+  }
+}
+
+size_t text_glyphs(mp_obj_t string, text_glyph_t* glyphs) {
+  // Look up the glyph of each character in the string so it can be drawn
+  // later without decoding the string again.  Returns the number of glyphs,
+  // and if glyphs is NULL only counts them.
+  size_t count = 0;
+  GET_STR_DATA_LEN(string, data, len);
+  const uint8_t* s = data;
+  const uint8_t* end = data + len;
+  while (s < end) {
+    if (glyphs != NULL) {
+      const glyph_cache_entry_t* glyph = find_glyph(utf8_get_char(s));
+      glyphs[count].character = glyph->character;
+      glyphs[count].dwidth = glyph->dwidth;
+    }
+    ++count;
+    s = utf8_next_char(s);
+  }
+  return count;
+}
+
+void text_render_columns(mp_obj_t string, uint8_t* buffer, size_t columns) {
+  // Render the string into a strip of columns in the native framebuffer
+  // format (a little-endian 16 bit word per column, row y at bit 15-y) so it
+  // can be drawn later by copying columns.  Columns past the end of buffer
+  // are dropped.  The buffer is expected to be zeroed.
+  size_t start = 0;
+  GET_STR_DATA_LEN(string, data, len);
+  const uint8_t* s = data;
+  const uint8_t* end = data + len;
+  while ((s < end) && (start < columns)) {
+    const glyph_cache_entry_t* glyph = find_glyph(utf8_get_char(s));
+    if (glyph->character != NULL) {
+      // Transpose the 11 bit rows into column words like draw_char.
+      uint16_t glyph_columns[11] = {0};
+      for (int y=0; y<11; ++y) {
+        uint16_t row = zpixfont_char_row(glyph->character, y);
+        uint16_t bit = 0x8000 >> y;
+        for (int x=0; row != 0; ++x) {
+          if (row & 0x400) {
+            glyph_columns[x] |= bit;
+          }
+          row = (row << 1) & 0x7FF;
+        }
+      }
+      for (size_t x=0; (x<11) && (start+x < columns); ++x) {
+        uint8_t* column = buffer + 2*(start+x);
+        column[0] |= glyph_columns[x] & 0xFF;
+        column[1] |= glyph_columns[x] >> 8;
+      }
+    }
+    start += glyph->dwidth;
     s = utf8_next_char(s);
   }
 }
 
 uint16_t text_width(mp_obj_t string) {
-  // Determine the pixel width of the specified string and return it.
+  // Determine the pixel width of the specified string and return it.  The
+  // string is walked once up to its end.
   uint16_t width = 0;
   GET_STR_DATA_LEN(string, data, len);
   const uint8_t* s = data;
-  for (unsigned int i=0; i<unichar_charlen((const char *)data, len); ++i) {
+  const uint8_t* end = data + len;
+  while (s < end) {
     unichar encoding = utf8_get_char(s);
-    // Find the character.
-    const zpixfont_character_t* character = zpixfont_find_character(encoding);
-    if (character != NULL) {
-      width += zpixfont_char_dwidth(character);
-    }
-    else {
-      // TODO: Handle character not found by rendering a box or similar
-      // missing character.  For now just skip 11 pixels.
-      width += 11;
-    }
+    // Find the character and add its width.
+    width += find_glyph(encoding)->dwidth;
     s = utf8_next_char(s);
   }
   return width;
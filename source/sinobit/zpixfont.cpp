@@ -29,7 +29,29 @@ extern "C" {
 uint8_t zpixfont_char_dwidth(const zpixfont_character_t* character) {
   // Grab the pixel width of this character from the bottom 4 bits of the
   // last data byte.
-  return character->data[15] & 0xF;
+  return character->data[ZPIXFONT_DATA_BYTES-1] & 0xF;
+}
+
+static uint16_t read_bits(const uint8_t* data, uint16_t start, uint8_t count) {
+  // Read count bits (up to 16) from the data starting at the specified bit
+  // position, where bit 0 is the most significant bit of the first byte.
+  uint32_t window = 0;
+  uint8_t end = (start + count + 7) / 8;
+  for (uint8_t i = start / 8; i < end; ++i) {
+    window = (window << 8) | data[i];
+  }
+  return (window >> (end*8 - start - count)) & ((1 << count) - 1);
+}
+
+uint16_t zpixfont_char_row(const zpixfont_character_t* character, uint8_t y) {
+  // Get row y (0-10) of the character bitmap as an 11 bit value, where the
+  // pixel at x is bit (10 - x).
+  uint16_t row = read_bits(character->data, y*ZPIXFONT_ROW_BITS, ZPIXFONT_ROW_BITS);
+#if ZPIXFONT_VERSION >= 3
+  // Compressed fonts store the index of the row in the row dictionary.
+  row = zpixfont.rows[row];
+#endif
+  return row;
 }
 
 const zpixfont_character_t* zpixfont_find_character(uint16_t encoding) {
@@ -37,25 +59,40 @@ const zpixfont_character_t* zpixfont_find_character(uint16_t encoding) {
   // or null if the character wasn't found.
   // Binary search for the desired encoding as we know the list of characters
   // is sorted in ascending encoding order (part of the cog generation script).
-  uint16_t head = 0;
-  uint16_t tail = zpixfont.count-1;
+#if ZPIXFONT_VERSION >= 2
+  // Use the page index to narrow the search down to just the characters that
+  // share the high byte of the encoding.
+  int page = (encoding >> 8) - zpixfont.first_page;
+  if ((page < 0) || (page >= zpixfont.page_count)) {
+    return NULL;
+  }
+  int head = zpixfont.pages[page];
+  int tail = zpixfont.pages[page+1]-1;
+#else
+  int head = 0;
+  int tail = zpixfont.count-1;
+#endif
+#if ZPIXFONT_VERSION >= 3
+  // Characters only store the low byte of their encoding, the page found
+  // above takes care of the high byte.
+  encoding &= 0xFF;
+#endif
   while (head <= tail) {
-    uint16_t mid = head + ((tail - head) / 2);
+    int mid = head + ((tail - head) / 2);
     if (zpixfont.characters[mid].encoding == encoding) {
       // Found the character at the midpoint!
       return &zpixfont.characters[mid];
     }
     else if (zpixfont.characters[mid].encoding > encoding) {
-      // Search to the right, midpoint is smaller than target encoding.
+      // Search to the left, midpoint is larger than target encoding.
       tail = mid-1;
     }
     else {
-      // Else search to the right, midpoint is larger than target encoding.
+      // Else search to the right, midpoint is smaller than target encoding.
       head = mid+1;
     }
   }
   // Couldn't find the character.
   return NULL;
 }
-
 }
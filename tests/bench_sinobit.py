@@ -0,0 +1,138 @@
+# Render benchmarks for the sinobit display, the on-device counterpart of
+# tools/sim/bench_display.cpp.  Times Latin and CJK text, a long scrolling
+# message drawn three ways, per-pixel vs native drawing and writes to the
+# display, and prints microseconds per frame.  The write cases wait for each
+# frame to go out on the display tick and report the time spent sending it
+# (display.send_time()) and the bits sent, since the tick rather than the
+# drawing sets how long a written frame takes.  If bench_baseline.txt is on the
+# micro:bit each case is compared against it: a write case sending more bits
+# per frame is a regression, time changes are reported and only flagged when
+# TOLERANCE is set to a percentage, as with the simulator's --tolerance.  Call
+# save() from the REPL after a run to store the results as the new baseline.
+import microbit
+import sinobit
+
+BASELINE = 'bench_baseline.txt'
+TOLERANCE = None
+
+LATIN = 'Hello, sino:bit!'
+CJK = '钢铁侠'
+LONG = ('The quick brown fox jumps over the lazy dog. 钢铁侠 '
+        '¿Hablas español? Parlez-vous Français? 0123456789')
+
+display = sinobit.display
+results = []
+bits_per_frame = {}
+
+
+def run(name, frames, draw):
+    start = microbit.running_time()
+    for frame in range(frames):
+        draw(frame)
+    elapsed = microbit.running_time() - start
+    results.append((name, elapsed * 1000 // frames))
+
+
+def text_redraw(message):
+    width = display.text_width(message)
+    def draw(frame):
+        display.clear()
+        display.text(11 - frame % (width + 12), 0, message)
+    return draw
+
+
+def text_ticker(message):
+    width = display.text_width(message)
+    def draw(frame):
+        display.ticker(message, frame % (width + 12))
+    return draw
+
+
+def text_strip(message):
+    strip = display.prepare_text(message)
+    width = len(strip) // 2
+    def draw(frame):
+        display.clear()
+        display.blit(strip, 0, 11 - frame % (width + 12))
+    return draw
+
+
+def pixels(frame):
+    i = frame % 6
+    display.clear()
+    for x in range(i, 12 - i):
+        display.set_pixel(x, i, True)
+        display.set_pixel(x, 11 - i, True)
+        display.set_pixel(i, x, True)
+        display.set_pixel(11 - i, x, True)
+
+
+def bulk(frame):
+    i = frame % 6
+    display.clear()
+    display.rect(i, i, 12 - 2 * i, 12 - 2 * i)
+
+
+def run_write(name, frames, draw):
+    send_time = display.send_time()
+    bits = display.bits_shifted()
+    for frame in range(frames):
+        draw(frame)
+        display.write(wait=True)
+    send_time = display.send_time() - send_time
+    bits = display.bits_shifted() - bits
+    results.append((name, send_time // frames))
+    bits_per_frame[name] = bits // frames
+
+
+def load_baseline():
+    baseline = {}
+    try:
+        with open(BASELINE) as f:
+            for line in f:
+                name, us, bits = line.split()
+                baseline[name] = (int(us), int(bits))
+    except OSError:
+        pass
+    return baseline
+
+
+def save():
+    with open(BASELINE, 'w') as f:
+        for name, us in results:
+            f.write('{} {} {}\n'.format(name, us, bits_per_frame.get(name, 0)))
+
+
+def main():
+    run('text_latin', 200, text_redraw(LATIN))
+    run('text_cjk', 200, text_redraw(CJK))
+    run('scroll_long_redraw', 200, text_redraw(LONG))
+    run('scroll_long_ticker', 200, text_ticker(LONG))
+    run('scroll_long_strip', 200, text_strip(LONG))
+    run('draw_pixels', 200, pixels)
+    run('draw_bulk', 200, bulk)
+    run_write('write_scroll', 200, text_ticker(LONG))
+    run_write('write_boxes', 200, bulk)
+    baseline = load_baseline()
+    regressions = 0
+    for name, us in results:
+        bits = bits_per_frame.get(name, 0)
+        flag = ''
+        if name in baseline:
+            base_us, base_bits = baseline[name]
+            flag = ' (baseline {})'.format(base_us)
+            if bits > base_bits or (TOLERANCE is not None and
+                                    us > base_us * (100 + TOLERANCE) // 100):
+                flag = ' REGRESSION (baseline {} us, {} bits)'.format(base_us, base_bits)
+                regressions += 1
+        if name in bits_per_frame:
+            flag = ' {} bits/frame{}'.format(bits, flag)
+        print('{:<20} {:>8} us/frame{}'.format(name, us, flag))
+    if baseline:
+        print('{} regressions against {}'.format(regressions, BASELINE))
+    else:
+        print('No baseline, call save() to store one')
+
+
+if __name__ == '__main__':
+    main()
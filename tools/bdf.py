@@ -106,21 +106,154 @@ class Character:
         else:
             return False
 
+    @property
+    def rows(self):
+        """The rendered bitmap packed into a tuple of one integer per row, in
+        the same format as the PackedCharacter rows member.
+        """
+        max_width, max_height = self.max_size
+        rows = []
+        for y in range(max_height):
+            row = 0
+            for pixel in self.bitmap[y*max_width:(y+1)*max_width]:
+                row = (row << 1) | pixel
+            rows.append(row)
+        return tuple(rows)
+
+
+class PackedCharacter:
+    """Instance of a character from a BDF font with its bitmap packed into one
+    integer per row.  These are created by the iter_characters generator and
+    have the same name, encoding, dwidth, bbox_size and bbox_offset members as
+    the Character class.  Instead of a list of booleans the bitmap is stored
+    in the rows member:
+     - rows: A tuple with one integer for each of the max_size height rows of
+             the character.  Pixel x of a row is stored in bit
+             (max_width - 1 - x), i.e. the left-most pixel is the most
+             significant bit.  Use get_pixel to read single pixels.
+    """
+
+    def __init__(self, name, encoding, dwidth, bbox_size, bbox_offset, rows):
+        self.name = name
+        self.encoding = encoding
+        self.dwidth = dwidth
+        self.bbox_size = bbox_size
+        self.bbox_offset = bbox_offset
+        self.rows = rows
+
+    def get_pixel(self, x, y):
+        """Retrieve a pixel from the rendered char at the specified x, y
+        position.  This is a boolean value that's true if the pixel is set and
+        false if not set or outside the max_size of the character.
+        """
+        max_width, max_height = Character.max_size
+        if 0 <= x < max_width and 0 <= y < max_height:
+            return (self.rows[y] >> (max_width - 1 - x)) & 1 == 1
+        else:
+            return False
+
+
+def _pack_bitmap(lines, bbox_size, bbox_offset):
+    # Render the hex BITMAP lines of a character into a tuple of row integers
+    # that are max_size wide and high.  Each line is decoded as a single
+    # integer and shifted into place, instead of handling each bit separately.
+    max_width, max_height = Character.max_size
+    rows = [0] * max_height
+    row_mask = (1 << max_width) - 1
+    # Same top left corner math as Character.parse, see it for details.
+    start_y = (max_height-1) - bbox_offset[1] - bbox_size[1]
+    start_x = bbox_offset[0]
+    for r, line in enumerate(lines):
+        y = start_y + r
+        if not 0 <= y < max_height or not line:
+            continue
+        # Line bits are padded out to a byte boundary on the right.  Shift
+        # them so the first bit of the line lands on pixel start_x, then mask
+        # off anything that falls outside of the character width.
+        shift = max_width - start_x - 4*len(line)
+        value = int(line, 16)
+        if shift >= 0:
+            value <<= shift
+        else:
+            value >>= -shift
+        rows[y] = value & row_mask
+    return tuple(rows)
+
+
+def _skip_character(infile):
+    # Consume the rest of a character up to and including its ENDCHAR line
+    # without parsing any of it.
+    for line in infile:
+        if line.startswith('ENDCHAR'):
+            return
+
+
+def iter_characters(infile, encodings=None):
+    """Generator that parses a BDF font from the specified input file and
+    yields a PackedCharacter for each character as soon as its ENDCHAR line
+    is read.  Nothing besides the character currently being parsed is kept in
+    memory so large fonts can be streamed.  Like the BDFFont class be sure to
+    set Character.max_size before parsing a font.
+
+    If encodings is specified it should be a container (like a set) of the
+    encodings to load.  Any character whose ENCODING is not in the container
+    is skipped as soon as its encoding is known, without parsing its bitmap.
+    """
+    for line in infile:
+        parts = line.split()
+        if len(parts) == 0 or parts[0] != 'STARTCHAR':
+            continue
+        name = parts[1]
+        encoding = None
+        dwidth = (0, 0)
+        bbox_size = (0, 0)
+        bbox_offset = (0, 0)
+        rows = None
+        for line in infile:
+            parts = line.split()
+            if len(parts) == 0:
+                continue
+            if parts[0] == 'ENCODING':
+                encoding = int(parts[1])
+                if encodings is not None and encoding not in encodings:
+                    _skip_character(infile)
+                    break
+            elif parts[0] == 'DWIDTH':
+                dwidth = (int(parts[1]), int(parts[2]))
+            elif parts[0] == 'BBX':
+                bbox_size = (int(parts[1]), int(parts[2]))
+                bbox_offset = (int(parts[3]), int(parts[4]))
+            elif parts[0] == 'BITMAP':
+                lines = [next(infile).strip() for _ in range(bbox_size[1])]
+                rows = _pack_bitmap(lines, bbox_size, bbox_offset)
+            elif parts[0] == 'ENDCHAR':
+                break
+        if encodings is not None and encoding not in encodings:
+            continue
+        if rows is None:
+            rows = (0,) * Character.max_size[1]
+        yield PackedCharacter(name, encoding, dwidth, bbox_size, bbox_offset,
+                              rows)
+
 
 class BDFFont:
     """Create an instance of a BDF font from the specified input file.  The
     file should be open for reading and will be read to load all the BDF font
     characters.  The loaded characters are stored in the characters instance
-    and are all instances of the Character class.
+    and are all instances of the Character class, or of the PackedCharacter
+    class if packed is True (much faster to parse for large fonts).
 
     Be sure to set the Character.max_size class-level variable before parsing
     a font.  This 2-tuple controls the width and height of each character's
     rendered bitmap data.
     """
 
-    def __init__(self, infile):
+    def __init__(self, infile, packed=False):
         self.characters = []
-        self.parse(infile)
+        if packed:
+            self.characters.extend(iter_characters(infile))
+        else:
+            self.parse(infile)
 
     def parse(self, infile):
         # Parse a BDF font file and load all the characters found within.
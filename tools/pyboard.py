@@ -37,6 +37,7 @@ Or:
 
 """
 
+import struct
 import sys
 import time
 
@@ -85,9 +86,17 @@ class TelnetToSerial:
             # the telnet object might not exist yet, so ignore this one
             pass
 
+    @property
+    def timeout(self):
+        return self.read_timeout
+
+    @timeout.setter
+    def timeout(self, value):
+        self.read_timeout = value
+
     def read(self, size=1):
+        timeout_count = 0
         while len(self.fifo) < size:
-            timeout_count = 0
             data = self.tn.read_eager()
             if len(data):
                 self.fifo.extend(data)
@@ -118,6 +127,8 @@ class TelnetToSerial:
 
 class Pyboard:
     def __init__(self, device, baudrate=115200, user='micro', password='python', wait=0):
+        self.unread = bytearray()
+        self.use_raw_paste = True
         if device and device[0].isdigit() and device[-1].isdigit() and device.count('.') == 3:
             # device looks like an IP address
             self.serial = TelnetToSerial(device, user, password, read_timeout=10)
@@ -148,25 +159,50 @@ class Pyboard:
         self.serial.close()
 
     def read_until(self, min_num_bytes, ending, timeout=10, data_consumer=None):
-        data = self.serial.read(min_num_bytes)
-        if data_consumer:
-            data_consumer(data)
-        timeout_count = 0
+        # Read everything that's waiting in one go into a growing buffer and
+        # only search the newly read tail for the ending.  Anything read past
+        # the ending is kept for the next call.  When nothing is waiting block
+        # on the port (up to timeout seconds without any data) for the next
+        # byte rather than polling.  The port keeps the timeout afterwards,
+        # setting it reconfigures a serial port so it's only set when it
+        # changes.
+        if self.serial.timeout != timeout:
+            self.serial.timeout = timeout
+        data = self.unread
+        self.unread = bytearray()
+        if len(data) < min_num_bytes:
+            data.extend(self.serial.read(min_num_bytes - len(data)))
+        searched = 0
+        consumed = 0
         while True:
-            if data.endswith(ending):
+            end = data.find(ending, max(0, searched - len(ending) + 1))
+            if end >= 0:
+                end += len(ending)
+                self.unread = data[end:]
+                del data[end:]
+            if data_consumer and len(data) > consumed:
+                data_consumer(bytes(data[consumed:]))
+                consumed = len(data)
+            if end >= 0:
                 break
-            elif self.serial.inWaiting() > 0:
-                new_data = self.serial.read(1)
-                data = data + new_data
-                if data_consumer:
-                    data_consumer(new_data)
-                timeout_count = 0
-            else:
-                timeout_count += 1
-                if timeout is not None and timeout_count >= 100 * timeout:
-                    break
-                time.sleep(0.01)
-        return data
+            searched = len(data)
+            new_data = self.serial.read(max(1, self.serial.inWaiting()))
+            if not new_data:
+                break
+            data.extend(new_data)
+        return bytes(data)
+
+    def read_bytes(self, num_bytes):
+        # Read num_bytes (fewer on a timeout), starting with anything an
+        # earlier read_until read past its ending.
+        data = self.unread[:num_bytes]
+        del self.unread[:num_bytes]
+        if len(data) < num_bytes:
+            data.extend(self.serial.read(num_bytes - len(data)))
+        return bytes(data)
+
+    def bytes_waiting(self):
+        return len(self.unread) + self.serial.inWaiting()
 
     def enter_raw_repl(self):
         self.serial.write(b'\r\x03\x03') # ctrl-C twice: interrupt any running program
@@ -176,6 +212,7 @@ class Pyboard:
         while n > 0:
             self.serial.read(n)
             n = self.serial.inWaiting()
+        self.unread = bytearray()
 
         self.serial.write(b'\r\x01') # ctrl-A: enter raw REPL
         data = self.read_until(1, b'raw REPL; CTRL-B to exit\r\n>')
@@ -214,6 +251,39 @@ class Pyboard:
         # return normal and error output
         return data, data_err
 
+    def raw_paste_write(self, command_bytes):
+        # Raw-paste mode: the device gives a window size and sends \x01 each
+        # time it has taken in another window of bytes, so the command can be
+        # written as fast as the link allows without overrunning its input
+        # buffer.  \x04 from the device means it wants to end the transfer.
+        data = self.read_bytes(2)
+        if len(data) != 2 or data == b'\x00\x00':
+            raise PyboardError('could not enter raw paste: {}'.format(data))
+        window_size = struct.unpack('<H', data)[0]
+        window_remain = window_size
+
+        i = 0
+        while i < len(command_bytes):
+            while window_remain == 0 or self.bytes_waiting():
+                data = self.read_bytes(1)
+                if data == b'\x01':
+                    window_remain += window_size
+                elif data == b'\x04':
+                    self.serial.write(b'\x04')
+                    return
+                else:
+                    raise PyboardError('unexpected read during raw paste: {}'.format(data))
+            b = command_bytes[i:min(i + window_remain, len(command_bytes))]
+            self.serial.write(b)
+            window_remain -= len(b)
+            i += len(b)
+
+        # indicate end of data and wait for the device to acknowledge it
+        self.serial.write(b'\x04')
+        data = self.read_until(1, b'\x04')
+        if not data.endswith(b'\x04'):
+            raise PyboardError('could not complete raw paste: {}'.format(data))
+
     def exec_raw_no_follow(self, command):
         if isinstance(command, bytes):
             command_bytes = command
@@ -225,14 +295,34 @@ class Pyboard:
         if not data.endswith(b'>'):
             raise PyboardError('could not enter raw repl')
 
-        # write command
+        if self.use_raw_paste:
+            # ctrl-E A ctrl-A: ask to enter raw-paste mode
+            self.serial.write(b'\x05A\x01')
+            data = self.read_bytes(2)
+            if data == b'R\x01':
+                return self.raw_paste_write(command_bytes)
+            elif data == b'R\x00':
+                # understood but not supported, the device gives a new prompt
+                data = self.read_until(1, b'>')
+            else:
+                # older firmware takes it as input to the raw REPL, where the
+                # ctrl-A resets it and prints the banner and prompt again
+                data = self.read_until(1, b'w REPL; CTRL-B to exit\r\n>')
+            if not data.endswith(b'>'):
+                print(data)
+                raise PyboardError('could not enter raw repl')
+            # don't try raw-paste mode again on this connection
+            self.use_raw_paste = False
+
+        # write command, throttled so the device's input buffer doesn't
+        # overflow
         for i in range(0, len(command_bytes), 32):
             self.serial.write(command_bytes[i:min(i + 32, len(command_bytes))])
             time.sleep(0.01)
         self.serial.write(b'\x04')
 
         # check if we could exec command
-        data = self.serial.read(2)
+        data = self.read_bytes(2)
         if data != b'OK':
             raise PyboardError('could not exec command')
 
@@ -0,0 +1,239 @@
+// Render benchmarks for the sinobit display code on the simulated hardware.
+// Each case draws (and for the write cases sends) a number of frames and
+// reports the host time and HT1632C bits per frame.  With --baseline the
+// results are compared to a stored baseline and the run fails if a case sends
+// more bits than it used to.  Bits are exact but times depend on the host and
+// vary from run to run, so time changes are only reported unless a tolerance
+// is given, in which case a case slower by more than that also fails.
+//
+// Usage: bench_display [--baseline FILE] [--save FILE] [--tolerance PERCENT]
+
+#include <chrono>
+#include <cstdio>
+#include <cstdlib>
+#include <cstring>
+
+#include "sim.h"
+
+extern "C" {
+#include "sinobitdisplay.h"
+#include "sinobittext.h"
+}
+
+#define MAX_CASES 32
+
+typedef struct {
+    const char *name;
+    double us_per_frame;
+    double bits_per_frame;
+} bench_result_t;
+
+static bench_result_t results[MAX_CASES];
+static int result_count = 0;
+
+// Latin, CJK (the Han characters built into the font) and a long message.
+static const char *LATIN = "Hello, sino:bit!";
+static const char *CJK = "\xe9\x92\xa2\xe9\x93\x81\xe4\xbe\xa0";
+static const char *LONG =
+    "The quick brown fox jumps over the lazy dog. "
+    "\xe9\x92\xa2\xe9\x93\x81\xe4\xbe\xa0 \xc2\xbfHablas espa\xc3\xb1ol? "
+    "Parlez-vous Fran\xc3\xa7" "ais? 0123456789";
+
+typedef void (*frame_fn_t)(int frame, void *arg);
+
+static void run(const char *name, int frames, frame_fn_t fn, void *arg) {
+    sim_clear_counters();
+    auto start = std::chrono::steady_clock::now();
+    for (int i = 0; i < frames; ++i) {
+        fn(i, arg);
+    }
+    auto end = std::chrono::steady_clock::now();
+    double us = std::chrono::duration<double, std::micro>(end-start).count();
+    bench_result_t *result = &results[result_count++];
+    result->name = name;
+    result->us_per_frame = us/frames;
+    result->bits_per_frame = (double)sim_bits()/frames;
+}
+
+// A string with its width worked out up front, so the cases only time the
+// drawing, and optionally pre-rendered as a strip of columns.
+typedef struct {
+    mp_obj_t text;
+    int width;
+    uint8_t *strip;
+} message_t;
+
+static message_t message(const char *str) {
+    message_t m;
+    m.text = sim_str(str);
+    m.width = text_width(m.text);
+    m.strip = (uint8_t*)calloc(2*m.width, 1);
+    text_render_columns(m.text, m.strip, m.width);
+    return m;
+}
+
+// Scroll a string across the display by clearing and drawing all of it.
+static void text_redraw(int frame, void *arg) {
+    message_t *m = (message_t*)arg;
+    framebuffer_fill(false);
+    text_draw_string(11-frame%(m->width+12), 0, m->text);
+}
+
+// Scroll a string one new column at a time.
+static void text_ticker(int frame, void *arg) {
+    message_t *m = (message_t*)arg;
+    framebuffer_scroll(0, -1, 0);
+    text_draw_column(11, 0, m->text, frame%(m->width+12));
+}
+
+// Scroll a pre-rendered string by blitting its columns.
+static void text_strip(int frame, void *arg) {
+    message_t *m = (message_t*)arg;
+    framebuffer_fill(false);
+    framebuffer_blit(m->strip, m->width, 0, 11-frame%(m->width+12));
+}
+
+// Draw a frame of boxes a pixel at a time.
+static void pixels(int frame, void *arg) {
+    (void)arg;
+    int i = frame%6;
+    framebuffer_fill(false);
+    for (int x = i; x < 12-i; ++x) {
+        framebuffer_set(x, i, true);
+        framebuffer_set(x, 11-i, true);
+        framebuffer_set(i, x, true);
+        framebuffer_set(11-i, x, true);
+    }
+}
+
+// Draw the same frame with the native primitives.
+static void bulk(int frame, void *arg) {
+    (void)arg;
+    int i = frame%6;
+    framebuffer_fill(false);
+    framebuffer_rect(i, i, 12-2*i, 12-2*i, 1);
+}
+
+typedef struct {
+    frame_fn_t draw;
+    void *arg;
+} write_case_t;
+
+// Draw a frame and send it to the display.
+static void write_frame(int frame, void *arg) {
+    write_case_t *write_case = (write_case_t*)arg;
+    write_case->draw(frame, write_case->arg);
+    framebuffer_write(false);
+    sim_tick();
+}
+
+static void bench_all() {
+    static message_t latin = message(LATIN);
+    static message_t cjk = message(CJK);
+    static message_t long_text = message(LONG);
+
+    sim_reset();
+    run("text_latin", 2000, text_redraw, &latin);
+    run("text_cjk", 2000, text_redraw, &cjk);
+    run("scroll_long_redraw", 2000, text_redraw, &long_text);
+    run("scroll_long_ticker", 2000, text_ticker, &long_text);
+    run("scroll_long_strip", 2000, text_strip, &long_text);
+    run("draw_pixels", 20000, pixels, NULL);
+    run("draw_bulk", 20000, bulk, NULL);
+    write_case_t scroll = { text_ticker, &long_text };
+    write_case_t boxes = { bulk, NULL };
+    sim_reset();
+    run("write_scroll_spi", 2000, write_frame, &scroll);
+    run("write_boxes_spi", 2000, write_frame, &boxes);
+    sim_reset();
+    sim_spi_busy(true);
+    run("write_scroll_bitbang", 2000, write_frame, &scroll);
+    run("write_boxes_bitbang", 2000, write_frame, &boxes);
+}
+
+static bool save(const char *path) {
+    FILE *f = fopen(path, "w");
+    if (f == NULL) {
+        perror(path);
+        return false;
+    }
+    fprintf(f, "# name us_per_frame bits_per_frame\n");
+    for (int i = 0; i < result_count; ++i) {
+        fprintf(f, "%s %.3f %.3f\n", results[i].name, results[i].us_per_frame, results[i].bits_per_frame);
+    }
+    fclose(f);
+    return true;
+}
+
+// Compare against a baseline file, returns the number of regressions.  A
+// negative tolerance only reports time changes.
+static int compare(const char *path, double tolerance) {
+    FILE *f = fopen(path, "r");
+    if (f == NULL) {
+        perror(path);
+        return 1;
+    }
+    int regressions = 0;
+    char line[256];
+    while (fgets(line, sizeof(line), f)) {
+        char name[64];
+        double us, bits;
+        if ((line[0] == '#') || (sscanf(line, "%63s %lf %lf", name, &us, &bits) != 3)) {
+            continue;
+        }
+        for (int i = 0; i < result_count; ++i) {
+            if (strcmp(results[i].name, name) != 0) {
+                continue;
+            }
+            double change = us > 0 ? 100*(results[i].us_per_frame/us-1) : 0;
+            if ((tolerance >= 0) && (change > tolerance)) {
+                printf("REGRESSION %s: %.3f us/frame, baseline %.3f (%+.0f%%)\n", name, results[i].us_per_frame, us, change);
+                regressions++;
+            }
+            else {
+                printf("%-24s %12.3f us/frame, baseline %.3f (%+.0f%%)\n", name, results[i].us_per_frame, us, change);
+            }
+            if (results[i].bits_per_frame > bits) {
+                printf("REGRESSION %s: %.3f bits/frame, baseline %.3f\n", name, results[i].bits_per_frame, bits);
+                regressions++;
+            }
+        }
+    }
+    fclose(f);
+    return regressions;
+}
+
+int main(int argc, char **argv) {
+    const char *baseline = NULL;
+    const char *save_path = NULL;
+    double tolerance = -1;
+    for (int i = 1; i < argc; ++i) {
+        if ((strcmp(argv[i], "--baseline") == 0) && (i+1 < argc)) {
+            baseline = argv[++i];
+        }
+        else if ((strcmp(argv[i], "--save") == 0) && (i+1 < argc)) {
+            save_path = argv[++i];
+        }
+        else if ((strcmp(argv[i], "--tolerance") == 0) && (i+1 < argc)) {
+            tolerance = atof(argv[++i]);
+        }
+        else {
+            fprintf(stderr, "usage: %s [--baseline FILE] [--save FILE] [--tolerance PERCENT]\n", argv[0]);
+            return 2;
+        }
+    }
+    bench_all();
+    printf("%-24s %12s %14s\n", "case", "us/frame", "bits/frame");
+    for (int i = 0; i < result_count; ++i) {
+        printf("%-24s %12.3f %14.3f\n", results[i].name, results[i].us_per_frame, results[i].bits_per_frame);
+    }
+    if ((save_path != NULL) && !save(save_path)) {
+        return 2;
+    }
+    if (baseline != NULL) {
+        int regressions = compare(baseline, tolerance);
+        printf("%d regressions against %s\n", regressions, baseline);
+        return regressions ? 1 : 0;
+    }
+    return 0;
+}
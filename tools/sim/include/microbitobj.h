@@ -0,0 +1,2 @@
+// Empty stand-in for the microbitobj.h firmware header, nothing from it is used by
+// the sinobit display code built for the simulator.
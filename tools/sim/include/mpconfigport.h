@@ -0,0 +1,33 @@
+#include <stdint.h>
+
+// Minimal MicroPython configuration for building the sinobit display code on
+// a (64-bit) host.  Only the object model and types are needed, there is no
+// interpreter in the simulator.
+
+#define MICROPY_OBJ_REPR            (MICROPY_OBJ_REPR_A)
+#define MICROPY_ENABLE_GC           (0)
+#define MICROPY_ERROR_REPORTING     (MICROPY_ERROR_REPORTING_TERSE)
+#define MICROPY_PY_BUILTINS_STR_UNICODE (1)
+#define MICROPY_PY_BUILTINS_BYTEARRAY (1)
+#define MICROPY_LONGINT_IMPL        (MICROPY_LONGINT_IMPL_NONE)
+#define MICROPY_FLOAT_IMPL          (MICROPY_FLOAT_IMPL_NONE)
+#define MICROPY_QSTR_BYTES_IN_HASH  (1)
+#define MICROPY_EMIT_X64            (0)
+#define MICROPY_EMIT_THUMB          (0)
+#define MICROPY_EMIT_INLINE_THUMB   (0)
+
+typedef intptr_t mp_int_t; // must be pointer size
+typedef uintptr_t mp_uint_t; // must be pointer size
+typedef void *machine_ptr_t; // must be of pointer size
+typedef const void *machine_const_ptr_t; // must be of pointer size
+typedef long mp_off_t;
+
+#define UINT_FMT "%lu"
+#define INT_FMT "%ld"
+#define BYTES_PER_WORD (sizeof(mp_int_t))
+#define MP_PLAT_PRINT_STRN(str, len) (void)0
+
+#define MICROPY_PORT_ROOT_POINTERS \
+    struct _sinobit_marquee_t *sinobit_marquee; \
+
+#define MP_STATE_PORT MP_STATE_VM
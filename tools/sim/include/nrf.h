@@ -0,0 +1,84 @@
+#ifndef __SIM_NRF_H__
+#define __SIM_NRF_H__
+
+// Stand-in for the nRF51 device header used when building the sinobit display
+// code on a host.  The GPIO and SPI peripherals are plain structs of register
+// objects whose reads and writes go to the simulator (see sim.cpp), which
+// models the HT1632C on the other end of the pins.
+
+#include <stdint.h>
+
+struct sim_register_t;
+typedef void (*sim_write_hook_t)(sim_register_t *reg, uint32_t value);
+typedef uint32_t (*sim_read_hook_t)(const sim_register_t *reg);
+
+struct sim_register_t {
+    uint32_t value;
+    sim_write_hook_t on_write;
+    sim_read_hook_t on_read;
+
+    sim_register_t &operator=(uint32_t v) {
+        if (on_write) {
+            on_write(this, v);
+        }
+        else {
+            value = v;
+        }
+        return *this;
+    }
+    operator uint32_t() const {
+        return on_read ? on_read(this) : value;
+    }
+};
+
+typedef struct {
+    sim_register_t OUT;
+    sim_register_t OUTSET;
+    sim_register_t OUTCLR;
+    sim_register_t IN;
+    sim_register_t DIR;
+    sim_register_t DIRSET;
+    sim_register_t DIRCLR;
+    sim_register_t PIN_CNF[32];
+} NRF_GPIO_Type;
+
+typedef struct {
+    sim_register_t EVENTS_READY;
+    sim_register_t INTENSET;
+    sim_register_t INTENCLR;
+    sim_register_t ENABLE;
+    sim_register_t PSELSCK;
+    sim_register_t PSELMOSI;
+    sim_register_t PSELMISO;
+    sim_register_t RXD;
+    sim_register_t TXD;
+    sim_register_t FREQUENCY;
+    sim_register_t CONFIG;
+} NRF_SPI_Type;
+
+extern "C" {
+extern NRF_GPIO_Type sim_gpio;
+extern NRF_SPI_Type sim_spi0;
+extern NRF_SPI_Type sim_spi1;
+}
+
+#define NRF_GPIO_BASE ((uintptr_t)&sim_gpio)
+#define NRF_SPI0 (&sim_spi0)
+#define NRF_SPI1 (&sim_spi1)
+
+#define SPI_ENABLE_ENABLE_Pos (0UL)
+#define SPI_ENABLE_ENABLE_Disabled (0x00UL)
+#define SPI_ENABLE_ENABLE_Enabled (0x01UL)
+#define SPI_FREQUENCY_FREQUENCY_M1 (0x10000000UL)
+#define SPI_FREQUENCY_FREQUENCY_M2 (0x20000000UL)
+#define SPI_FREQUENCY_FREQUENCY_M4 (0x40000000UL)
+#define SPI_CONFIG_ORDER_Pos (0UL)
+#define SPI_CONFIG_ORDER_MsbFirst (0UL)
+#define SPI_CONFIG_CPHA_Pos (1UL)
+#define SPI_CONFIG_CPHA_Trailing (1UL)
+#define SPI_CONFIG_CPOL_Pos (2UL)
+#define SPI_CONFIG_CPOL_ActiveLow (1UL)
+
+static inline void __WFI(void) {}
+
+#endif
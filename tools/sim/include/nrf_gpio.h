@@ -0,0 +1 @@
+#include "nrf.h"
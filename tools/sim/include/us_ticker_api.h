@@ -0,0 +1,10 @@
+#ifndef __SIM_US_TICKER_API_H__
+#define __SIM_US_TICKER_API_H__
+
+// Stand-in for the mbed microsecond ticker, sim.cpp counts host time.
+
+#include <stdint.h>
+
+uint32_t us_ticker_read(void);
+
+#endif
@@ -0,0 +1,122 @@
+// Stand-ins for the MicroPython runtime that the Python bindings in
+// sinobitdisplay.cpp link against.  The simulator calls the C functions
+// directly and has no interpreter, so apart from the objects and types needed
+// to make strings these just stop the program if they're ever reached.
+
+#include <cstdio>
+#include <cstdlib>
+
+extern "C" {
+
+#include "py/obj.h"
+#include "py/mpstate.h"
+#include "py/nlr.h"
+#include "py/runtime.h"
+
+struct _mp_obj_none_t {
+    mp_obj_base_t base;
+};
+
+struct _mp_obj_bool_t {
+    mp_obj_base_t base;
+    bool value;
+};
+
+mp_state_ctx_t mp_state_ctx;
+
+const mp_obj_type_t mp_type_str = { { NULL }, MP_QSTR_str };
+const mp_obj_type_t mp_type_bool = { { NULL }, MP_QSTR_bool };
+const mp_obj_type_t mp_type_dict = { { NULL }, MP_QSTR_dict };
+const mp_obj_type_t mp_type_module = { { NULL }, MP_QSTR_module };
+const mp_obj_type_t mp_type_fun_builtin = { { NULL }, MP_QSTR_function };
+const mp_obj_type_t mp_type_TypeError = { { NULL }, MP_QSTR_TypeError };
+const mp_obj_type_t mp_type_ValueError = { { NULL }, MP_QSTR_ValueError };
+
+const struct _mp_obj_none_t mp_const_none_obj = { { NULL } };
+const struct _mp_obj_bool_t mp_const_false_obj = { { &mp_type_bool }, false };
+const struct _mp_obj_bool_t mp_const_true_obj = { { &mp_type_bool }, true };
+
+static void unavailable(const char *name) {
+    fprintf(stderr, "%s is not available in the simulator\n", name);
+    abort();
+}
+
+void *m_malloc(size_t num_bytes) {
+    return calloc(1, num_bytes);
+}
+
+const byte *qstr_data(qstr q, size_t *len) {
+    (void)q;
+    (void)len;
+    unavailable("qstr_data");
+    return NULL;
+}
+
+mp_uint_t qstr_hash(qstr q) {
+    (void)q;
+    unavailable("qstr_hash");
+    return 0;
+}
+
+NORETURN void nlr_jump(void *val) {
+    (void)val;
+    unavailable("nlr_jump");
+    abort();
+}
+
+mp_int_t mp_obj_get_int(mp_const_obj_t arg) {
+    (void)arg;
+    unavailable("mp_obj_get_int");
+    return 0;
+}
+
+bool mp_obj_is_true(mp_obj_t arg) {
+    (void)arg;
+    unavailable("mp_obj_is_true");
+    return false;
+}
+
+void mp_arg_parse_all(size_t n_pos, const mp_obj_t *pos, mp_map_t *kws, size_t n_allowed, const mp_arg_t *allowed, mp_arg_val_t *out_vals) {
+    (void)n_pos;
+    (void)pos;
+    (void)kws;
+    (void)n_allowed;
+    (void)allowed;
+    (void)out_vals;
+    unavailable("mp_arg_parse_all");
+}
+
+void mp_get_buffer_raise(mp_obj_t obj, mp_buffer_info_t *bufinfo, mp_uint_t flags) {
+    (void)obj;
+    (void)bufinfo;
+    (void)flags;
+    unavailable("mp_get_buffer_raise");
+}
+
+mp_obj_t mp_obj_new_exception_msg(const mp_obj_type_t *exc_type, const char *msg) {
+    (void)exc_type;
+    unavailable(msg);
+    return MP_OBJ_NULL;
+}
+
+mp_obj_t mp_obj_new_int_from_uint(mp_uint_t value) {
+    (void)value;
+    unavailable("mp_obj_new_int_from_uint");
+    return MP_OBJ_NULL;
+}
+
+mp_obj_t mp_obj_new_tuple(mp_uint_t n, const mp_obj_t *items) {
+    (void)n;
+    (void)items;
+    unavailable("mp_obj_new_tuple");
+    return MP_OBJ_NULL;
+}
+
+mp_obj_t mp_obj_new_bytearray_by_ref(mp_uint_t n, void *items) {
+    (void)n;
+    (void)items;
+    unavailable("mp_obj_new_bytearray_by_ref");
+    return MP_OBJ_NULL;
+}
+
+}
@@ -0,0 +1,315 @@
+#include <chrono>
+#include <cstdio>
+#include <cstdlib>
+#include <cstring>
+
+#include "nrf.h"
+#include "sim.h"
+
+extern "C" {
+
+#include "py/objstr.h"
+#include "lib/ticker.h"
+#include "sinobitdisplay.h"
+
+// Pins of the HT1632C, see sinobitdisplay.cpp.
+#define HT_CS 16
+#define HT_DATA 21
+#define HT_RD 22
+#define HT_WR 23
+
+// HT1632C command and mode IDs (the first 3 bits of a transfer).
+#define HT_ID_CMD 0x4
+#define HT_ID_WRITE 0x5
+#define HT_ID_READ 0x6
+
+// The HT1632C has 96 addresses of 4 bits of RAM, kept one bit per entry in the
+// order the bits are clocked in.
+#define HT_RAM_BITS (96*4)
+
+NRF_GPIO_Type sim_gpio;
+NRF_SPI_Type sim_spi0;
+NRF_SPI_Type sim_spi1;
+
+static struct {
+    uint32_t out;
+    uint8_t ram[HT_RAM_BITS];
+    // Current transfer.
+    uint8_t id;
+    uint8_t id_bits;
+    uint16_t command;
+    uint8_t command_bits;
+    uint8_t address;
+    uint8_t address_bits;
+    uint16_t data_bits;
+    uint32_t read_bit;
+    // State set by commands.
+    uint8_t brightness;
+    bool led_on;
+    // Counters.
+    uint32_t bits;
+    uint32_t transfers;
+    uint32_t spi_bytes;
+    uint32_t spi_pending;
+} ht;
+
+static ticker_callback_ptr fast_callbacks[3];
+
+static bool pin(uint32_t state, int n) {
+    return (state >> n) & 1;
+}
+
+static void ht_command(uint8_t command) {
+    if ((command & 0xF0) == 0xA0) {
+        ht.brightness = command & 0x0F;
+    }
+    else if (command == 0x03) {
+        ht.led_on = true;
+    }
+    else if (command == 0x02) {
+        ht.led_on = false;
+    }
+}
+
+// Clock one bit into the HT1632C (a rising edge of WR with CS low).
+static void ht_clock(bool bit) {
+    ht.bits++;
+    if (ht.id_bits < 3) {
+        ht.id = (ht.id << 1) | bit;
+        ht.id_bits++;
+        return;
+    }
+    if (ht.id == HT_ID_CMD) {
+        // 8 command bits and a don't care bit, commands can be chained.
+        ht.command = (ht.command << 1) | bit;
+        if (++ht.command_bits == 9) {
+            ht_command(ht.command >> 1);
+            ht.command = 0;
+            ht.command_bits = 0;
+        }
+        return;
+    }
+    if (ht.address_bits < 7) {
+        ht.address = (ht.address << 1) | bit;
+        ht.address_bits++;
+        return;
+    }
+    if (ht.id == HT_ID_WRITE) {
+        // The address increments every 4 bits and wraps around.
+        ht.ram[(ht.address*4 + ht.data_bits) % HT_RAM_BITS] = bit;
+        ht.data_bits++;
+    }
+}
+
+static void ht_cs(bool low) {
+    if (low) {
+        ht.id = 0;
+        ht.id_bits = 0;
+        ht.command = 0;
+        ht.command_bits = 0;
+        ht.address = 0;
+        ht.address_bits = 0;
+        ht.data_bits = 0;
+        ht.read_bit = 0;
+        ht.transfers++;
+    }
+}
+
+// Update the pins driven by the nRF51 and react to edges.
+static void set_out(uint32_t out) {
+    uint32_t old = ht.out;
+    ht.out = out;
+    if (pin(old, HT_CS) != pin(out, HT_CS)) {
+        ht_cs(!pin(out, HT_CS));
+    }
+    if (pin(out, HT_CS)) {
+        return;
+    }
+    if (!pin(old, HT_WR) && pin(out, HT_WR)) {
+        ht_clock(pin(out, HT_DATA));
+    }
+    if (pin(old, HT_RD) && !pin(out, HT_RD)) {
+        // Falling RD moves to the next bit of a read.
+        ht.read_bit++;
+    }
+}
+
+static void gpio_write(sim_register_t *reg, uint32_t value) {
+    if (reg == &sim_gpio.OUTSET) {
+        set_out(ht.out | value);
+    }
+    else if (reg == &sim_gpio.OUTCLR) {
+        set_out(ht.out & ~value);
+    }
+    else if (reg == &sim_gpio.OUT) {
+        set_out(value);
+    }
+    else if (reg == &sim_gpio.DIRSET) {
+        sim_gpio.DIR.value |= value;
+    }
+    else if (reg == &sim_gpio.DIRCLR) {
+        sim_gpio.DIR.value &= ~value;
+    }
+    else {
+        reg->value = value;
+    }
+}
+
+static uint32_t gpio_read(const sim_register_t *reg) {
+    if (reg == &sim_gpio.IN) {
+        // During a read the HT1632C drives DATA with the RAM bit selected by
+        // the address and the number of RD pulses.
+        uint32_t in = ht.out;
+        in &= ~(1 << HT_DATA);
+        if (!pin(ht.out, HT_CS) && (ht.id == HT_ID_READ) && (ht.read_bit > 0)) {
+            uint32_t bit = (ht.address*4 + ht.read_bit-1) % HT_RAM_BITS;
+            in |= ht.ram[bit] << HT_DATA;
+        }
+        return in;
+    }
+    if (reg == &sim_gpio.OUT) {
+        return ht.out;
+    }
+    return reg->value;
+}
+
+static void spi_write(sim_register_t *reg, uint32_t value) {
+    NRF_SPI_Type *spi = &sim_spi1;
+    if (reg == &spi->TXD) {
+        // Shift out a byte, MSB first.  Mode 3 latches on the rising clock
+        // edge like the HT1632C WR input.
+        if ((spi->ENABLE.value == SPI_ENABLE_ENABLE_Enabled) &&
+            (spi->PSELSCK.value == HT_WR) && (spi->PSELMOSI.value == HT_DATA) &&
+            !pin(ht.out, HT_CS)) {
+            for (int i = 7; i >= 0; --i) {
+                ht_clock((value >> i) & 1);
+            }
+        }
+        ht.spi_bytes++;
+        ht.spi_pending++;
+    }
+    else if (reg == &spi->EVENTS_READY) {
+        // Clearing the event acknowledges one finished byte.
+        if ((value == 0) && (ht.spi_pending > 0)) {
+            ht.spi_pending--;
+        }
+    }
+    else {
+        reg->value = value;
+    }
+}
+
+static uint32_t spi_read(const sim_register_t *reg) {
+    if (reg == &sim_spi1.EVENTS_READY) {
+        return ht.spi_pending > 0;
+    }
+    return reg->value;
+}
+
+static void hook(sim_register_t *regs, size_t count, sim_write_hook_t on_write, sim_read_hook_t on_read) {
+    for (size_t i = 0; i < count; ++i) {
+        regs[i].value = 0;
+        regs[i].on_write = on_write;
+        regs[i].on_read = on_read;
+    }
+}
+
+void sim_reset() {
+    memset(&ht, 0, sizeof(ht));
+    // The pins idle high.
+    ht.out = (1 << HT_CS) | (1 << HT_WR) | (1 << HT_RD) | (1 << HT_DATA);
+    hook((sim_register_t*)&sim_gpio, sizeof(sim_gpio)/sizeof(sim_register_t), gpio_write, gpio_read);
+    hook((sim_register_t*)&sim_spi1, sizeof(sim_spi1)/sizeof(sim_register_t), spi_write, spi_read);
+    hook((sim_register_t*)&sim_spi0, sizeof(sim_spi0)/sizeof(sim_register_t), NULL, NULL);
+    sinobit_display_init();
+    sim_clear_counters();
+}
+
+void sim_frame(uint16_t frame[12]) {
+    // Column c is the 12 bits at address 4*c, the inverse of what
+    // HT1632C_Write_DAT sends.
+    for (int col = 0; col < 12; ++col) {
+        frame[col] = 0;
+        for (int i = 0; i < 12; ++i) {
+            if (ht.ram[16*col + i]) {
+                frame[col] |= 0x8000 >> i;
+            }
+        }
+    }
+}
+
+uint8_t sim_brightness() {
+    return ht.brightness;
+}
+
+bool sim_led_on() {
+    return ht.led_on;
+}
+
+uint32_t sim_bits() {
+    return ht.bits;
+}
+
+uint32_t sim_transfers() {
+    return ht.transfers;
+}
+
+uint32_t sim_spi_bytes() {
+    return ht.spi_bytes;
+}
+
+void sim_clear_counters() {
+    ht.bits = 0;
+    ht.transfers = 0;
+    ht.spi_bytes = 0;
+}
+
+void sim_spi_busy(bool busy) {
+    // I2C uses the same ENABLE register with a different value.
+    sim_spi1.ENABLE.value = busy ? 5 : 0;
+}
+
+void sim_tick() {
+    sinobit_display_tick();
+}
+
+int32_t sim_fast_tick(uint32_t index) {
+    if ((index >= 3) || (fast_callbacks[index] == NULL)) {
+        return -1;
+    }
+    return fast_callbacks[index]();
+}
+
+mp_obj_t sim_str(const char *str) {
+    mp_obj_str_t *o = (mp_obj_str_t*)calloc(1, sizeof(mp_obj_str_t));
+    o->base.type = &mp_type_str;
+    o->len = strlen(str);
+    o->data = (const byte*)str;
+    return MP_OBJ_FROM_PTR(o);
+}
+
+uint32_t us_ticker_read(void) {
+    static const auto start = std::chrono::steady_clock::now();
+    auto elapsed = std::chrono::steady_clock::now() - start;
+    return std::chrono::duration_cast<std::chrono::microseconds>(elapsed).count();
+}
+
+// Fast ticker slots, see source/lib/ticker.c.
+int set_ticker_callback(uint32_t index, ticker_callback_ptr func, int32_t initial_delay_us) {
+    (void)initial_delay_us;
+    if (index >= 3) {
+        return -1;
+    }
+    fast_callbacks[index] = func;
+    return 0;
+}
+
+int clear_ticker_callback(uint32_t index) {
+    if (index >= 3) {
+        return -1;
+    }
+    fast_callbacks[index] = NULL;
+    return 0;
+}
+
+}
@@ -0,0 +1,51 @@
+#ifndef __SIM_H__
+#define __SIM_H__
+
+// Host simulator for the sinobit display.  The framebuffer, text and font
+// code from source/sinobit is built unchanged against mock nRF51 GPIO and SPI
+// registers, and a model of the HT1632C decodes the bits clocked out on the
+// pins back into its display RAM so frames can be checked and measured
+// without a board.
+
+#include <cstdint>
+
+#include "py/obj.h"
+
+extern "C" {
+
+// Reset the HT1632C model, peripherals and counters, and initialize the
+// display driver (sinobit_display_init).
+void sim_reset();
+
+// Get the 12 columns shown by the HT1632C in the framebuffer format.
+void sim_frame(uint16_t frame[12]);
+
+// HT1632C state set by commands.
+uint8_t sim_brightness();
+bool sim_led_on();
+
+// Counters since the last sim_reset or sim_clear_counters: bits clocked into
+// the HT1632C, transfers (CS low periods) and bytes sent through the SPI
+// peripheral.
+uint32_t sim_bits();
+uint32_t sim_transfers();
+uint32_t sim_spi_bytes();
+void sim_clear_counters();
+
+// Make the SPI peripheral look like it's in use (e.g. by I2C) so the display
+// falls back to bit-banging.
+void sim_spi_busy(bool busy);
+
+// Run one 6ms slow tick of the display.
+void sim_tick();
+
+// Run the fast ticker callback in a slot (returns -1 if none is set),
+// returning the number of 16us ticks until it should run again.
+int32_t sim_fast_tick(uint32_t index);
+
+// Make a string object for the text functions.
+mp_obj_t sim_str(const char *str);
+
+}
+
+#endif
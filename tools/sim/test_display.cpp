@@ -0,0 +1,347 @@
+// Checks of the sinobit display code against the simulated HT1632C.  Build
+// and run with "make test".
+
+#include <cstdio>
+#include <cstdlib>
+#include <cstring>
+
+#include "sim.h"
+
+extern "C" {
+#include "sinobitdisplay.h"
+#include "sinobittext.h"
+}
+
+static int checks = 0;
+static int failures = 0;
+
+#define CHECK(cond) check((cond), #cond, __FILE__, __LINE__)
+
+static void check(bool ok, const char *what, const char *file, int line) {
+    checks++;
+    if (!ok) {
+        failures++;
+        printf("%s:%d: check failed: %s\n", file, line, what);
+    }
+}
+
+static bool frame_shown() {
+    // Check the HT1632C shows the framebuffer (ignoring the unused bits).
+    uint16_t frame[12];
+    sim_frame(frame);
+    for (int col = 0; col < 12; ++col) {
+        if (frame[col] != (framebuffer[col] & 0xFFF0)) {
+            return false;
+        }
+    }
+    return true;
+}
+
+static void random_frame() {
+    for (int col = 0; col < 12; ++col) {
+        framebuffer[col] = rand() & 0xFFF0;
+    }
+}
+
+static void test_init() {
+    sim_reset();
+    uint16_t frame[12];
+    sim_frame(frame);
+    for (int col = 0; col < 12; ++col) {
+        CHECK(frame[col] == 0);
+    }
+    CHECK(sim_led_on());
+    CHECK(sim_brightness() == 15);
+}
+
+static void test_write(bool spi_busy) {
+    sim_reset();
+    sim_spi_busy(spi_busy);
+    for (int i = 0; i < 20; ++i) {
+        random_frame();
+        framebuffer_write(i == 0);
+        // Nothing is sent until the tick.
+        CHECK(framebuffer_write_pending());
+        sim_tick();
+        CHECK(!framebuffer_write_pending());
+        CHECK(frame_shown());
+    }
+    CHECK((sim_spi_bytes() > 0) == !spi_busy);
+}
+
+static void test_dirty_columns(bool spi_busy) {
+    sim_reset();
+    sim_spi_busy(spi_busy);
+    random_frame();
+    framebuffer_write(false);
+    sim_tick();
+    // An unchanged frame isn't sent again.
+    sim_clear_counters();
+    framebuffer_write(false);
+    sim_tick();
+    CHECK(sim_transfers() == 0);
+    // One changed column is a 3 bit ID, 7 bit address and the column, which
+    // is 16 bits over SPI and 12 bits bit-banged.
+    framebuffer[5] ^= 0x8000;
+    framebuffer_write(false);
+    sim_tick();
+    CHECK(sim_transfers() == 1);
+    CHECK(sim_bits() == (spi_busy ? 10+12 : 10+16));
+    CHECK(frame_shown());
+    // A full write sends every column.
+    sim_clear_counters();
+    framebuffer_write(true);
+    sim_tick();
+    CHECK(frame_shown());
+    CHECK(sim_bits() >= 10+11*16+12);
+}
+
+static void test_writes_merge() {
+    sim_reset();
+    // Several writes before a tick end up as one transfer of the last frame.
+    for (int i = 0; i < 10; ++i) {
+        random_frame();
+        framebuffer_write(false);
+    }
+    sim_tick();
+    CHECK(sim_transfers() == 1);
+    CHECK(frame_shown());
+}
+
+static void test_primitives() {
+    sim_reset();
+    uint16_t expected[12];
+    framebuffer_fill(false);
+    framebuffer_fill_rect(2, 3, 4, 5, 1);
+    memset(expected, 0, sizeof(expected));
+    for (int y = 3; y < 8; ++y) {
+        for (int x = 2; x < 6; ++x) {
+            expected[y] |= 0x8000 >> x;
+        }
+    }
+    CHECK(memcmp(framebuffer, expected, sizeof(expected)) == 0);
+    // Clipped to the display.
+    framebuffer_fill(false);
+    framebuffer_fill_rect(-5, -5, 30, 30, 1);
+    for (int col = 0; col < 12; ++col) {
+        CHECK(framebuffer[col] == 0xFFF0);
+    }
+    framebuffer_fill(false);
+    framebuffer_line(0, 0, 11, 11, 1);
+    for (int i = 0; i < 12; ++i) {
+        CHECK(framebuffer[i] == (0x8000 >> i));
+    }
+    // Scrolling one pixel at a time matches drawing at an offset.
+    framebuffer_fill(false);
+    framebuffer_rect(1, 1, 6, 6, 1);
+    framebuffer_scroll(2, -1, 0);
+    memcpy(expected, framebuffer, sizeof(expected));
+    framebuffer_fill(false);
+    framebuffer_rect(3, 0, 6, 6, 1);
+    CHECK(memcmp(framebuffer, expected, sizeof(expected)) == 0);
+    framebuffer_write(false);
+    sim_tick();
+    CHECK(frame_shown());
+}
+
+static void reference_line(uint16_t frame[], int x0, int y0, int x1, int y1) {
+    // Plain Bresenham over the whole line, one pixel at a time.
+    int dx = abs(x1-x0);
+    int dy = abs(y1-y0);
+    int sx = x0 < x1 ? 1 : -1;
+    int sy = y0 < y1 ? 1 : -1;
+    int err = dx-dy;
+    while (true) {
+        if ((x0 >= 0) && (x0 < 12) && (y0 >= 0) && (y0 < 12)) {
+            frame[y0] |= 0x8000 >> x0;
+        }
+        if ((x0 == x1) && (y0 == y1)) {
+            break;
+        }
+        int e2 = 2*err;
+        if (e2 > -dy) {
+            err -= dy;
+            x0 += sx;
+        }
+        if (e2 < dx) {
+            err += dx;
+            y0 += sy;
+        }
+    }
+}
+
+static void test_line_clipping() {
+    // Lines reaching far off the display draw the same pixels as walking the
+    // whole line.
+    sim_reset();
+    uint16_t expected[12];
+    for (int i = 0; i < 20000; ++i) {
+        int range = i < 10000 ? 40 : 400;
+        int x0 = rand()%range - range/2;
+        int y0 = rand()%range - range/2;
+        int x1 = rand()%range - range/2;
+        int y1 = rand()%range - range/2;
+        memset(expected, 0, sizeof(expected));
+        reference_line(expected, x0, y0, x1, y1);
+        framebuffer_fill(false);
+        framebuffer_line(x0, y0, x1, y1, 1);
+        CHECK(memcmp(framebuffer, expected, sizeof(expected)) == 0);
+    }
+    // A huge line still draws its visible part.
+    framebuffer_fill(false);
+    framebuffer_line(0, 0, 1000000000, 1, 1);
+    CHECK(framebuffer[0] == 0xFFF0);
+    framebuffer_fill(false);
+    framebuffer_line(-1000000000, -1000000000, 1000000000, 1000000000, 1);
+    for (int i = 0; i < 12; ++i) {
+        CHECK(framebuffer[i] == (0x8000 >> i));
+    }
+}
+
+static void test_text() {
+    sim_reset();
+    mp_obj_t text = sim_str("Hi \xe4\xbd\xa0\xe5\xa5\xbd!");
+    int width = text_width(text);
+    CHECK(width > 0);
+    // A pre-rendered strip blitted at each offset matches drawing the string,
+    // and so does scrolling in one column at a time.
+    uint8_t *strip = (uint8_t*)calloc(2*width, 1);
+    text_render_columns(text, strip, width);
+    uint16_t expected[12];
+    for (int offset = 0; offset < width; ++offset) {
+        framebuffer_fill(false);
+        text_draw_string(-offset, 0, text);
+        memcpy(expected, framebuffer, sizeof(expected));
+        framebuffer_fill(false);
+        framebuffer_blit(strip, width, 0, -offset);
+        CHECK(memcmp(framebuffer, expected, sizeof(expected)) == 0);
+    }
+    framebuffer_fill(false);
+    for (int offset = 0; offset < width+12; ++offset) {
+        framebuffer_scroll(0, -1, 0);
+        text_draw_column(11, 0, text, offset);
+    }
+    memcpy(expected, framebuffer, sizeof(expected));
+    framebuffer_fill(false);
+    text_draw_string(12-(width+12), 0, text);
+    CHECK(memcmp(framebuffer, expected, sizeof(expected)) == 0);
+    free(strip);
+    framebuffer_fill(false);
+    text_draw_string(0, 0, text);
+    framebuffer_write(false);
+    sim_tick();
+    CHECK(frame_shown());
+}
+
+static void test_text_column() {
+    // Drawing columns in any order, switching strings in between, matches
+    // drawing the whole string at an offset.
+    sim_reset();
+    mp_obj_t text = sim_str("Hi \xe9\x92\xa2\xe9\x93\x81\xe4\xbe\xa0!");
+    mp_obj_t other = sim_str("Other");
+    int width = text_width(text);
+    int offsets[] = {0, 5, 3, 3, 20, 7, width-1, 1, width, 14};
+    uint16_t expected[12];
+    for (size_t i = 0; i < sizeof(offsets)/sizeof(offsets[0]); ++i) {
+        int offset = offsets[i];
+        framebuffer_fill(false);
+        text_draw_string(11-offset, 0, text);
+        expected[11] = framebuffer[11];
+        framebuffer_fill(false);
+        text_draw_column(11, 0, text, offset);
+        CHECK(framebuffer[11] == expected[11]);
+        text_draw_column(0, 0, other, offset % 8);
+    }
+}
+
+static void test_blit_clipping() {
+    // Blits entirely off the display leave the framebuffer (and the memory
+    // around it) alone.
+    sim_reset();
+    uint8_t strip[2*20];
+    memset(strip, 0xFF, sizeof(strip));
+    int columns = sizeof(strip)/2;
+    int ys[] = {12, 13, 100, -columns, -columns-1};
+    for (size_t i = 0; i < sizeof(ys)/sizeof(ys[0]); ++i) {
+        framebuffer_fill(false);
+        framebuffer_blit(strip, columns, 0, ys[i]);
+        for (int col = 0; col < 12; ++col) {
+            CHECK(framebuffer[col] == 0);
+        }
+    }
+    // Partly on the display at either end.
+    framebuffer_fill(false);
+    framebuffer_blit(strip, columns, 0, 11);
+    CHECK(framebuffer[10] == 0);
+    CHECK(framebuffer[11] == 0xFFF0);
+    framebuffer_fill(false);
+    framebuffer_blit(strip, columns, 0, 1-columns);
+    CHECK(framebuffer[0] == 0xFFF0);
+    CHECK(framebuffer[1] == 0);
+}
+
+static void test_blit_shifted() {
+    // Rows shifted past the bottom of the display are dropped rather than
+    // left in the unused low bits.
+    sim_reset();
+    uint8_t strip[2*12];
+    memset(strip, 0xFF, sizeof(strip));
+    for (int x = 1; x <= 4; ++x) {
+        framebuffer_fill(false);
+        framebuffer_blit(strip, 12, x, 0);
+        for (int col = 0; col < 12; ++col) {
+            CHECK((framebuffer[col] & 0xF) == 0);
+            CHECK(framebuffer[col] == ((0xFFF0 >> x) & 0xFFF0));
+        }
+    }
+}
+
+static void test_greyscale() {
+    sim_reset();
+    CHECK(!framebuffer_set_levels(3));
+    CHECK(framebuffer_set_levels(4));
+    CHECK(framebuffer_levels() == 4);
+    framebuffer_set_level(0, 0, 1);
+    framebuffer_set_level(1, 0, 2);
+    framebuffer_set_level(2, 0, 3);
+    CHECK(framebuffer_get_level(0, 0) == 1);
+    CHECK(framebuffer_get_level(1, 0) == 2);
+    CHECK(framebuffer_get_level(2, 0) == 3);
+    framebuffer_write(false);
+    // The slow tick leaves the bus to the fast ticker in greyscale mode.
+    sim_clear_counters();
+    sim_tick();
+    CHECK(sim_transfers() == 0);
+    // Plane 0 (1 unit of time) has levels 1 and 3, plane 1 (2 units) has
+    // levels 2 and 3.
+    uint16_t frame[12];
+    int32_t ticks0 = sim_fast_tick(1);
+    sim_frame(frame);
+    CHECK(frame[0] == 0xA000);
+    int32_t ticks1 = sim_fast_tick(1);
+    sim_frame(frame);
+    CHECK(frame[0] == 0x6000);
+    CHECK(ticks1 == 2*ticks0);
+    CHECK(framebuffer_set_levels(2));
+    CHECK(sim_fast_tick(1) == -1);
+    sim_tick();
+    CHECK(frame_shown());
+}
+
+int main() {
+    test_init();
+    test_write(false);
+    test_write(true);
+    test_dirty_columns(false);
+    test_dirty_columns(true);
+    test_writes_merge();
+    test_primitives();
+    test_line_clipping();
+    test_text();
+    test_text_column();
+    test_blit_clipping();
+    test_blit_shifted();
+    test_greyscale();
+    printf("%d checks, %d failed\n", checks, failures);
+    return failures ? 1 : 0;
+}
@@ -10,18 +10,42 @@
 # Font structure:
 # - uint8_t version: A number that indicates the 'version' of the font format.
 #                    This is useful for forwards an backwards compatibility.
-#                    For this font the version is always set to 1.  Later
-#                    versions might increment the value and have a completely
-#                    different structure.
+#                    Version 1 is the structure below without the page index
+#                    fields, version 2 adds the page index fields and version
+#                    3 adds the row dictionary fields and compresses the
+#                    character data (see below).
 # - uint16_t count:  The number of characters in the font.
+# - uint8_t first_page: (Version 2+) The first page in the page index.  A
+#                       page is the 256 encodings that share the same high
+#                       byte, i.e. page = encoding >> 8.
+# - uint16_t page_count: (Version 2+) The number of pages in the index, from
+#                        first_page up to the page of the last character.
+# - uint16_t[page_count+1] pages: (Version 2+) Index of the first character
+#                                 in each page, i.e. the characters of page p
+#                                 are at indices pages[p-first_page] up to (but
+#                                 not including) pages[p-first_page+1].  The
+#                                 last entry is always count.
+# - uint16_t row_count: (Version 3 only) The number of rows in the row
+#                       dictionary.
+# - uint16_t[row_count] rows: (Version 3 only) Dictionary of every unique 11
+#                             pixel character row in the font, in ascending
+#                             order.  Pixel x of a row is bit (10 - x).
 # - character[] characters:  An array of character data.  Each character
 #                            instance is a fixed size struct defined below.
 #                            This array is _sorted_ by ascending character
 #                            encoding order to allow fast space-efficient
-#                            lookup with binary search.
+#                            lookup with binary search (within a page for
+#                            version 2+).
+#
+# The generated header also defines these macros for the firmware code:
+# - ZPIXFONT_VERSION: The font format version.
+# - ZPIXFONT_DATA_BYTES: The size of the character data array.
+# - ZPIXFONT_ROW_BITS: The number of data bits used for each character row.
 #
 # Character structure:
-# - uint16_t encoding: The unicode encoding / code point of the character.
+# - uint16_t encoding: The unicode encoding / code point of the character.  For
+#                      version 3 this is a uint8_t with only the low byte of
+#                      the encoding, the page index provides the high byte.
 # - uint8_t[16] data: Array of 16 bytes that tightly packs an 11x11 grid of
 #                     character bitmap data.  For alignment purposes there will
 #                     be 7 extra bits added (since 11x11 = 121 bits which is
@@ -53,13 +77,97 @@
 # - Given byte index and offset (from right) find x, y:
 #   y = (byte_index*8+(7-byte_offset)) // 11
 #   x = (byte_index*8+(7-byte_offset)) % 11
+#
+# Version 3 compressed character data:
+# Instead of the pixels of each row the data stores the index of each row in
+# the font's row dictionary.  Every index is ZPIXFONT_ROW_BITS bits, just
+# enough bits to index all the rows of the dictionary, and the indices are
+# packed one after another from the most significant bit of the first byte
+# (exactly like the 11 bit rows above).  The four low bits of the last byte
+# are the pixel width like above.  ZPIXFONT_DATA_BYTES is the number of bytes
+# needed for 11 indices and the width, so a font with no more than 256 unique
+# rows only needs 12 data bytes per character.
+#
+# Parsed font cache:
+# Parsing a large BDF font is slow so the packed characters that are loaded
+# can be cached in a compact binary file (by default in build/zpixcache of this
+# repository, named after the BDF file with a .zpixcache extension, so nothing
+# is written inside the zpix submodule).  The cache is keyed on a hash of the
+# BDF file contents, the character max size and the loaded encodings and is
+# rebuilt whenever any of them change.  All values are little endian:
+# - bytes[4] magic: Always b'ZPXC'.
+# - uint8 version: Version of the cache format, currently 1.
+# - bytes[32] key: SHA-256 digest of the BDF file contents, max size and
+#                  encodings.
+# - uint32 count: The number of characters in the cache.
+# - record[count] characters: One fixed size record for each character:
+#   - uint32 encoding: The unicode encoding / code point of the character.
+#   - uint8 dwidth: The pixel width of the character.
+#   - uint8[16] data: The packed character data (see above).
+# - names: The name of each character, in the same order as the records, as
+#          ASCII strings separated by newlines.
+import argparse
+import collections
+import functools
+import hashlib
+import json
+import multiprocessing
+import os
+import struct
+import sys
+
 import bdf
 
 
+CACHE_MAGIC = b'ZPXC'
+CACHE_VERSION = 1
+_CACHE_HEADER = struct.Struct('<4sB32sI')
+_CACHE_RECORD = struct.Struct('<IB16s')
+CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..',
+                         'build', 'zpixcache')
+
+# Since the 11x11 grid is packed row after row with the left-most pixel in the
+# most significant bit, the 16 bytes of character data are simply a 128-bit big
+# endian number made of the 11 rows (11 bits each) followed by 3 unused bits
+# and the 4-bit width.  This table holds the left shift of each row inside that
+# number so packing and unpacking is a handful of shifts and masks per row.
+ROW_SHIFTS = tuple(128 - 11*(y+1) for y in range(11))
+ROW_MASK = 0x7FF
+
+
+def pack_rows(rows, dwidth):
+    """Pack 11 character rows and the pixel width of a character into the
+    16 byte data format described above.  Each row is an integer with pixel x
+    in bit (10 - x), i.e. the rows member of bdf.PackedCharacter.
+    """
+    value = dwidth & 0xF
+    for row, shift in zip(rows, ROW_SHIFTS):
+        value |= (row & ROW_MASK) << shift
+    return bytearray(value.to_bytes(16, 'big'))
+
+
+def unpack_data(data):
+    """Unpack 16 bytes of character data into a 2-tuple of the 11 character
+    rows (in the same format pack_rows accepts) and the pixel width.  This is
+    the inverse of pack_rows and is useful to verify packed data.
+    """
+    value = int.from_bytes(data, 'big')
+    rows = tuple((value >> shift) & ROW_MASK for shift in ROW_SHIFTS)
+    return rows, value & 0xF
+
+
+# Stand-in for a BDF character when a character is loaded from the cache.
+CachedCharacter = collections.namedtuple('CachedCharacter',
+                                         ['name', 'encoding', 'dwidth'])
+
+
 class ZpixFontCharacter:
 
-    def __init__(self, character):
+    def __init__(self, character, data=None):
         self._character = character
+        # Already packed character data (like from a cache), or None to pack
+        # the data from the character bitmap when it's requested.
+        self._data = data
 
     @property
     def name(self):
@@ -79,32 +187,145 @@ class ZpixFontCharacter:
         16 byte array of bitmap data.  The last byte's 4 low bits also encode
         the pixel width of the character.
         """
-        data = bytearray(16)
-        # Go through each pixel of the character bitmap and encode it in the
-        # bitmap bits.  If the a pixel is set then inject a 1 bit, otherwise
-        # keep it as a 0 bit (unset pixel).
-        for y in range(11):
-            for x in range(11):
-                byte_index = (y*11+x) // 8
-                byte_offset = 7-((y*11+x) % 8)
-                if self._character.get_pixel(x, y):
-                    data[byte_index] |= (1 << byte_offset)
-        # Add the dwidth as the lowest 4 bits of the entire array.
-        data[15] |= (self._character.dwidth[0] & 0xF)
-        return data
+        if self._data is not None:
+            return bytearray(self._data)
+        return pack_rows(self._character.rows, self._character.dwidth[0])
+
+    @property
+    def dwidth(self):
+        """The pixel width of the character.
+        """
+        return self._character.dwidth[0]
+
+
+def expand_encodings(*args):
+    """Build a set of character encodings from the specified arguments.  Each
+    argument can be an individual encoding / code point number, or an iterable
+    of size 2 that defines the inclusive range of code points to include (like
+    (10, 100) would include all code points between 10 and 100, including 10
+    and 100).
+    """
+    encodings = set()
+    for val in args:
+        # Handle single numbers.
+        if isinstance(val, int):
+            encodings.add(val)
+        # Handle iterables (lists/tuples)
+        elif len(val) == 2:
+            encodings.update(range(val[0], val[1]+1))
+    return encodings
+
+
+def cache_key(font_bdf, wanted=None):
+    """Compute the key of the parsed font cache for the specified BDF file and
+    set of wanted encodings (None for the entire font).  This is a SHA-256
+    digest of the file contents, the current bdf.Character.max_size value and
+    the sorted encodings.
+    """
+    digest = hashlib.sha256()
+    with open(font_bdf, 'rb') as infile:
+        digest.update(infile.read())
+    digest.update('{0}x{1}'.format(*bdf.Character.max_size).encode('ascii'))
+    if wanted is not None:
+        encodings = sorted(wanted)
+        digest.update(struct.pack('<{0}I'.format(len(encodings)), *encodings))
+    return digest.digest()
+
+
+def write_cache(cache_file, key, characters):
+    """Write a parsed font cache file with the specified key and list of
+    ZpixFontCharacter instances.  The file is written to a temporary name
+    first and then moved into place so a partial cache is never read.
+    """
+    parts = [_CACHE_HEADER.pack(CACHE_MAGIC, CACHE_VERSION, key,
+                                len(characters))]
+    for c in characters:
+        parts.append(_CACHE_RECORD.pack(c.encoding, c.dwidth, bytes(c.data)))
+    parts.append('\n'.join(c.name for c in characters).encode('ascii'))
+    temp_file = cache_file + '.tmp'
+    os.makedirs(os.path.dirname(os.path.abspath(cache_file)), exist_ok=True)
+    with open(temp_file, 'wb') as outfile:
+        outfile.write(b''.join(parts))
+    os.replace(temp_file, cache_file)
+
+
+def read_cache(cache_file, key):
+    """Read a parsed font cache file and return a list of ZpixFontCharacter
+    instances.  Returns None if the cache doesn't exist, is for a different
+    format version, or doesn't match the specified key.
+    """
+    try:
+        with open(cache_file, 'rb') as infile:
+            cache = infile.read()
+    except OSError:
+        return None
+    if len(cache) < _CACHE_HEADER.size:
+        return None
+    magic, version, cached_key, count = _CACHE_HEADER.unpack_from(cache)
+    if magic != CACHE_MAGIC or version != CACHE_VERSION or cached_key != key:
+        return None
+    start = _CACHE_HEADER.size
+    end = start + count*_CACHE_RECORD.size
+    if len(cache) < end:
+        return None
+    names = cache[end:].decode('ascii').split('\n')
+    if len(names) != count:
+        return None
+    characters = []
+    records = _CACHE_RECORD.iter_unpack(cache[start:end])
+    for name, (encoding, dwidth, data) in zip(names, records):
+        character = CachedCharacter(name, encoding, (dwidth, 0))
+        characters.append(ZpixFontCharacter(character, data))
+    return characters
 
 
 class ZpixFont:
 
-    def __init__(self, font_bdf='./zpix/src/Zpix.bdf'):
+    def __init__(self, font_bdf='./zpix/src/Zpix.bdf', encodings=None,
+                 cache=False):
+        """Load the Zpix font from the specified BDF file.  If encodings is
+        specified it should be a list of encodings and inclusive encoding
+        ranges (the same values get_characters accepts) and only those
+        characters are loaded.  All other characters are skipped without
+        parsing their bitmap data, which is much faster when only a few
+        characters of a large font are needed.
+
+        If cache is True (or the path of a cache file) the packed characters
+        are loaded from a parsed font cache file, which is (re)built from the
+        BDF font when it's missing, out of date or for other encodings.  By
+        default the cache file is in CACHE_DIR, named after the BDF file with
+        a .zpixcache extension added.
+        """
         bdf.Character.max_size = (11, 11)
-        with open(font_bdf, 'r') as infile:
-            self._zpix = bdf.BDFFont(infile)
-        # Build a dictionary of character encoding value to BDF font character.
-        # This allows fast lookups of BDF characters.
+        wanted = None
+        if encodings is not None:
+            wanted = expand_encodings(*encodings)
+        # Build a dictionary of character encoding value to character.
+        # This allows fast lookups of characters.
         self._characters = {}
-        for c in self._zpix.characters:
-            self._characters[c.encoding] = c
+        if cache:
+            cache_file = cache
+            if cache is True:
+                cache_file = os.path.join(
+                    CACHE_DIR, os.path.basename(font_bdf) + '.zpixcache')
+            key = cache_key(font_bdf, wanted)
+            characters = read_cache(cache_file, key)
+            if characters is None:
+                characters = pack_characters(self._load_bdf(font_bdf, wanted))
+                write_cache(cache_file, key, characters)
+            for c in characters:
+                self._characters[c.encoding] = c
+        else:
+            for c in self._load_bdf(font_bdf, wanted):
+                self._characters[c.encoding] = c
+
+    def _load_bdf(self, font_bdf, wanted=None):
+        # Parse the wanted characters (or all of them if wanted is None) from
+        # the BDF font.  The font is streamed with the packed parser so no
+        # intermediate list of every BDF character is built.
+        with open(font_bdf, 'r') as infile:
+            return [ZpixFontCharacter(c)
+                    for c in bdf.iter_characters(infile, wanted)]
 
     def get_characters(self, *args):
         """Retrieve instances of ZPixFontCharacters for all the specified
@@ -117,50 +338,295 @@ class ZpixFont:
         returned results are sorted in ascending encoding / code point order.
         """
         # Build a sorted set of all the encodings.
-        encodings = set()
-        for val in args:
-            # Handle single numbers.
-            if isinstance(val, int):
-                encodings.add(val)
-            # Handle iterables (lists/tuples)
-            elif len(val) == 2:
-                encodings.update(range(val[0], val[1]+1))
+        encodings = expand_encodings(*args)
         # Sort the set of encodings and iterate through it to assemble a list
         # of result characters to return.
         characters = []
         for e in sorted(encodings):
             if e in self._characters:
-                characters.append(ZpixFontCharacter(self._characters[e]))
+                characters.append(self._characters[e])
         return characters
 
 
-if __name__ == '__main__':
-    # Simple test case to serialize a few characters and print them as C code.
-    font = ZpixFont()
-    chars = font.get_characters(33, 34, (35, 40))
-    print(f'// Encoded {len(chars)} characters:')
-    print(f"""const struct {{
-  uint8_t version;
-  uint16_t count;
-  struct {{
-    uint16_t encoding;
-    uint8_t data[16];
-  }} characters[{len(chars)}];
-}} zpixFont = {{
-  .version = 1,
-  .count = {len(chars)},
-  .characters = {{""")
-    for c in chars[:-1]:
-        data_bytes = ', '.join(map(lambda x: f'0x{x:02X}', c.data))
-        print(f"""    {{
-      .encoding = {c.encoding},\t// {c.name}
-      .data = {{ {data_bytes} }}
-    }},""")
-    c = chars[-1]
-    data_bytes = ', '.join(map(lambda x: f'0x{x:02X}', c.data))
-    print(f"""    {{
-      .encoding = {c.encoding},\t// {c.name}
+def _pack_chunk(chunk):
+    # Pack a chunk of (rows, dwidth) tuples, run inside a worker process.
+    return [bytes(pack_rows(rows, dwidth)) for rows, dwidth in chunk]
+
+
+def pack_characters(characters, processes=1, chunk_size=1024):
+    """Pack the data of a list of ZpixFontCharacter instances and return a new
+    list of ZpixFontCharacter instances, in the same order, with the packed
+    data filled in.  By default everything is packed in this process.  If
+    processes is more than 1 (or None for the number of CPUs) the characters
+    are split into chunks of chunk_size and packed in a pool of that many
+    worker processes.  Lists that fit in a single chunk are still packed in
+    this process since starting a pool would take longer than the packing.
+    """
+    todo = [c for c in characters if c._data is None]
+    work = [(c._character.rows, c.dwidth) for c in todo]
+    chunks = [work[i:i+chunk_size] for i in range(0, len(work), chunk_size)]
+    if processes is None:
+        processes = os.cpu_count() or 1
+    if len(chunks) > 1 and processes > 1:
+        with multiprocessing.Pool(processes) as pool:
+            packed = pool.map(_pack_chunk, chunks)
+    else:
+        packed = [_pack_chunk(chunk) for chunk in chunks]
+    data = {}
+    for c, d in zip(todo, (d for chunk in packed for d in chunk)):
+        data[id(c)] = d
+    return [ZpixFontCharacter(c._character, data.get(id(c), c._data))
+            for c in characters]
+
+
+def build_pages(characters):
+    """Build the version 2 page index for a list of ZpixFontCharacter instances
+    sorted by encoding.  Returns a 2-tuple of the first page number and a list
+    of the index of the first character in each page from the first page up to
+    the last character's page, followed by the character count.
+    """
+    if not characters:
+        return 0, [0]
+    first_page = characters[0].encoding >> 8
+    last_page = characters[-1].encoding >> 8
+    pages = []
+    i = 0
+    for page in range(first_page, last_page+1):
+        while i < len(characters) and characters[i].encoding >> 8 < page:
+            i += 1
+        pages.append(i)
+    pages.append(len(characters))
+    return first_page, pages
+
+
+def build_row_dictionary(characters):
+    """Build the version 3 row dictionary for a list of ZpixFontCharacter
+    instances.  Returns a 2-tuple of the sorted list of unique rows and the
+    number of bits needed to index it.
+    """
+    rows = set()
+    for c in characters:
+        rows.update(unpack_data(c.data)[0])
+    rows = sorted(rows)
+    return rows, max(1, (len(rows)-1).bit_length())
+
+
+def compressed_size(row_bits):
+    """Return the number of data bytes of a version 3 character with the
+    specified bits per row index.
+    """
+    return (11*row_bits + 4 + 7) // 8
+
+
+def compress_data(data, row_index, row_bits):
+    """Compress 16 bytes of character data to the version 3 format using a
+    dictionary of row value to row index and the bits per row index.
+    """
+    rows, dwidth = unpack_data(data)
+    size = compressed_size(row_bits)
+    value = 0
+    for row in rows:
+        value = (value << row_bits) | row_index[row]
+    value = (value << (size*8 - 11*row_bits)) | (dwidth & 0xF)
+    return bytearray(value.to_bytes(size, 'big'))
+
+
+def decompress_data(data, rows, row_bits):
+    """Decompress version 3 character data back to the 16 byte format using
+    the row dictionary and bits per row index.  This is the inverse of
+    compress_data and is useful to verify compressed data.
+    """
+    value = int.from_bytes(data, 'big')
+    shift = len(data)*8
+    indices = []
+    for y in range(11):
+        shift -= row_bits
+        indices.append((value >> shift) & ((1 << row_bits) - 1))
+    return pack_rows([rows[i] for i in indices], value & 0xF)
+
+
+def _font_layout(characters, version):
+    # Compute the row dictionary, bits per row and data bytes per character of
+    # the specified font format version.
+    if version >= 3:
+        rows, row_bits = build_row_dictionary(characters)
+        return rows, row_bits, compressed_size(row_bits)
+    return None, 11, 16
+
+
+def format_defines(characters, version=1):
+    """Format the C macros that describe the zpixfont struct of the specified
+    characters and font format version.  Returns a string without a trailing
+    newline.
+    """
+    if version not in (1, 2, 3):
+        raise ValueError(f'Unsupported font format version: {version}')
+    rows, row_bits, data_bytes = _font_layout(characters, version)
+    return f"""#define ZPIXFONT_VERSION {version}
+#define ZPIXFONT_DATA_BYTES {data_bytes}
+#define ZPIXFONT_ROW_BITS {row_bits}"""
+
+
+def format_font(characters, version=1):
+    """Format a list of ZpixFontCharacter instances (sorted by encoding) as the
+    C definition of the zpixfont struct that is generated in
+    inc/sinobit/zpixfont.h.  The version selects the font format version
+    (1, 2 or 3, see above) and must match the format_defines version.  Returns
+    a string without a trailing newline.
+    """
+    if version not in (1, 2, 3):
+        raise ValueError(f'Unsupported font format version: {version}')
+    rows, row_bits, data_bytes = _font_layout(characters, version)
+    fields = ['  uint8_t version;', '  uint16_t count;']
+    values = [f'  .version = {version},', f'  .count = {len(characters)},']
+    if version >= 2:
+        first_page, pages = build_pages(characters)
+        page_starts = ', '.join(map(str, pages))
+        fields.extend(['  uint8_t first_page;',
+                       '  uint16_t page_count;',
+                       f'  uint16_t pages[{len(pages)}];'])
+        values.extend([f'  .first_page = {first_page},',
+                       f'  .page_count = {len(pages)-1},',
+                       f'  .pages = {{ {page_starts} }},'])
+    if version >= 3:
+        row_values = ', '.join(map(lambda x: f'0x{x:03X}', rows))
+        fields.extend(['  uint16_t row_count;',
+                       f'  uint16_t rows[{len(rows)}];'])
+        values.extend([f'  .row_count = {len(rows)},',
+                       f'  .rows = {{ {row_values} }},'])
+        row_index = {row: i for i, row in enumerate(rows)}
+    fields.append(f'  zpixfont_character_t characters[{len(characters)}];')
+    values.append('  .characters = {')
+    lines = [f'// Encoded {len(characters)} characters:',
+             'const struct {'] + fields + ['} zpixfont = {'] + values
+    for i, c in enumerate(characters):
+        data = c.data
+        encoding = c.encoding
+        if version >= 3:
+            data = compress_data(data, row_index, row_bits)
+            encoding &= 0xFF
+        data_bytes = ', '.join(map(lambda x: f'0x{x:02X}', data))
+        separator = ',' if i < len(characters)-1 else ''
+        lines.append(f"""    {{
+      .encoding = {encoding},\t// {c.name}
       .data = {{ {data_bytes} }}
-    }}
-  }}
-}};""")
+    }}{separator}""")
+    lines.append("""  }
+};""")
+    return '\n'.join(lines)
+
+
+def font_size(characters, version=1):
+    """Return the number of bytes of flash used by the zpixfont struct of the
+    specified characters and font format version (ignoring any alignment
+    padding the compiler might add).
+    """
+    rows, row_bits, data_bytes = _font_layout(characters, version)
+    size = 3 + len(characters)*(data_bytes + 2)
+    if version >= 2:
+        first_page, pages = build_pages(characters)
+        size += 3 + 2*len(pages)
+    if version >= 3:
+        # Characters only store the low byte of their encoding.
+        size += 2 + 2*len(rows) - len(characters)
+    return size
+
+
+def size_report(characters):
+    """Return a string that reports the size of the specified characters in
+    each font format version, compared to version 1.
+    """
+    rows, row_bits = build_row_dictionary(characters)
+    lines = [f'{len(characters)} characters, {len(rows)} unique rows '
+             f'({row_bits} bits per row index):']
+    base = font_size(characters, 1)
+    for version in (1, 2, 3):
+        size = font_size(characters, version)
+        per_kb = len(characters) / (size / 1024)
+        lines.append(f' version {version}: {size} bytes, '
+                     f'{per_kb:.1f} characters per KB, '
+                     f'{100*size/base:.1f}% of version 1')
+    return '\n'.join(lines)
+
+
+@functools.lru_cache()
+def load_config(config_file):
+    """Load the characters and font format version that are configured in
+    the sinobit_micropython section of a config.json file.  Returns a 2-tuple
+    of the list of packed ZpixFontCharacter instances and the version.  The
+    parsed font cache is used and the result is remembered so each cog block
+    of inc/sinobit/zpixfont.h can call this cheaply.
+    """
+    with open(config_file, 'r') as infile:
+        config = json.load(infile)['sinobit_micropython']
+    encodings = config['zpixfont_encodings']
+    font = ZpixFont(config['zpixfont_bdf'], encodings, cache=True)
+    chars = pack_characters(font.get_characters(*encodings))
+    return chars, config.get('zpixfont_version', 1)
+
+
+def _parse_encoding(value):
+    # Parse a command line encoding, either a number or an inclusive range
+    # like 32-126.  Numbers can be decimal or prefixed with 0x for hex.
+    if '-' in value:
+        start, end = value.split('-', 1)
+        return (int(start, 0), int(end, 0))
+    return int(value, 0)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description='Generate the packed zpixfont C struct for a set of '
+                    'character encodings.')
+    parser.add_argument('encodings', nargs='*', type=_parse_encoding,
+                        help='Encodings or inclusive ranges (like 32-126) to '
+                             'include.  Defaults to the config encodings.')
+    parser.add_argument('--config', help='Path to a config.json to read the '
+                        'zpixfont_bdf and zpixfont_encodings values from.')
+    parser.add_argument('--bdf', help='Path to the BDF font file.')
+    parser.add_argument('--cache', action='store_true',
+                        help='Use the parsed font cache in build/zpixcache.')
+    parser.add_argument('-j', '--jobs', dest='processes', type=int,
+                        default=1, help='Number of processes to pack with '
+                        '(default is 1, 0 for the number of CPUs).')
+    parser.add_argument('-o', '--output', help='File to write the C struct '
+                        'to (default is standard output).')
+    parser.add_argument('--format-version', type=int, default=None,
+                        help='Font format version to generate (default is '
+                             'the config zpixfont_version, or 1).')
+    parser.add_argument('--report', action='store_true',
+                        help='Print a report of the font size in each format '
+                             'version to standard error.')
+    args = parser.parse_args(argv)
+    font_bdf = './zpix/src/Zpix.bdf'
+    encodings = args.encodings
+    version = 1
+    if args.config:
+        with open(args.config, 'r') as infile:
+            config = json.load(infile)['sinobit_micropython']
+        font_bdf = config['zpixfont_bdf']
+        version = config.get('zpixfont_version', 1)
+        if not encodings:
+            encodings = config['zpixfont_encodings']
+    if args.bdf:
+        font_bdf = args.bdf
+    if args.format_version is not None:
+        version = args.format_version
+    if not encodings:
+        parser.error('no encodings specified')
+    font = ZpixFont(font_bdf, encodings, cache=args.cache)
+    chars = pack_characters(font.get_characters(*encodings),
+                            args.processes or None)
+    output = format_defines(chars, version) + '\n' + \
+             format_font(chars, version) + '\n'
+    if args.report:
+        sys.stderr.write(size_report(chars) + '\n')
+    if args.output:
+        with open(args.output, 'w') as outfile:
+            outfile.write(output)
+    else:
+        sys.stdout.write(output)
+
+
+if __name__ == '__main__':
+    main()